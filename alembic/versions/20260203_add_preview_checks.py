@@ -6,8 +6,7 @@ Create Date: 2026-02-03 00:00:00.000000
 
 """
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy import inspect
+from sqlalchemy import text
 
 revision = "20260203_add_preview_checks"
 down_revision = "20240914_create_delivery_outbox"
@@ -15,32 +14,29 @@ branch_labels = None
 depends_on = None
 
 
-def _column_exists(table_name: str, column_name: str) -> bool:
-    cols = inspect(op.get_bind()).get_columns(table_name)
-    return any(c.get("name") == column_name for c in cols)
-
-
 def upgrade() -> None:
-    if not _column_exists("delivery_outbox", "preview_url"):
-        op.add_column("delivery_outbox", sa.Column("preview_url", sa.String(), nullable=True))
-
-    if not _column_exists("delivery_outbox", "site_check_attempts"):
-        op.add_column(
-            "delivery_outbox",
-            sa.Column("site_check_attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
-        )
-
-    if not _column_exists("delivery_outbox", "site_check_next_at"):
-        op.add_column(
-            "delivery_outbox",
-            sa.Column("site_check_next_at", sa.DateTime(timezone=True), nullable=True),
+    # One ALTER TABLE takes the table lock once; IF NOT EXISTS keeps it idempotent
+    # for databases that already picked these columns up out-of-band.
+    op.execute(
+        text(
+            """
+            ALTER TABLE delivery_outbox
+                ADD COLUMN IF NOT EXISTS preview_url VARCHAR,
+                ADD COLUMN IF NOT EXISTS site_check_attempts INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS site_check_next_at TIMESTAMP WITH TIME ZONE
+            """
         )
+    )
 
 
 def downgrade() -> None:
-    if _column_exists("delivery_outbox", "site_check_next_at"):
-        op.drop_column("delivery_outbox", "site_check_next_at")
-    if _column_exists("delivery_outbox", "site_check_attempts"):
-        op.drop_column("delivery_outbox", "site_check_attempts")
-    if _column_exists("delivery_outbox", "preview_url"):
-        op.drop_column("delivery_outbox", "preview_url")
+    op.execute(
+        text(
+            """
+            ALTER TABLE delivery_outbox
+                DROP COLUMN IF EXISTS site_check_next_at,
+                DROP COLUMN IF EXISTS site_check_attempts,
+                DROP COLUMN IF EXISTS preview_url
+            """
+        )
+    )
@@ -17,17 +17,20 @@ branch_labels = None
 depends_on = None
 
 
-def _table_exists(table_name: str) -> bool:
-    return inspect(op.get_bind()).has_table(table_name)
-
-
-def _index_exists(table_name: str, index_name: str) -> bool:
-    indexes = inspect(op.get_bind()).get_indexes(table_name)
-    return any(idx.get("name") == index_name for idx in indexes)
+def _existing_indexes(insp, table_name: str, existing_tables: set[str]) -> set[str]:
+    if table_name not in existing_tables:
+        return set()
+    return {idx["name"] for idx in insp.get_indexes(table_name)}
 
 
 def upgrade() -> None:
-    if not _table_exists("job_copies"):
+    # Snapshot schema state once up front; every guard below is a set lookup.
+    insp = inspect(op.get_bind())
+    existing_tables = set(insp.get_table_names())
+    copy_indexes = _existing_indexes(insp, "job_copies", existing_tables)
+    deleted_indexes = _existing_indexes(insp, "recently_deleted_job_copies", existing_tables)
+
+    if "job_copies" not in existing_tables:
         op.create_table(
             "job_copies",
             sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
@@ -45,12 +48,12 @@ def upgrade() -> None:
             sa.UniqueConstraint("job_id", name="uq_job_copies_job_id"),
         )
 
-    if not _index_exists("job_copies", "ix_job_copies_client_name"):
+    if "ix_job_copies_client_name" not in copy_indexes:
         op.create_index("ix_job_copies_client_name", "job_copies", ["client_name"], unique=False)
-    if not _index_exists("job_copies", "ix_job_copies_created_at"):
+    if "ix_job_copies_created_at" not in copy_indexes:
         op.create_index("ix_job_copies_created_at", "job_copies", ["created_at"], unique=False)
 
-    if not _table_exists("recently_deleted_job_copies"):
+    if "recently_deleted_job_copies" not in existing_tables:
         op.create_table(
             "recently_deleted_job_copies",
             sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
@@ -68,14 +71,14 @@ def upgrade() -> None:
             sa.UniqueConstraint("job_id", name="uq_recently_deleted_job_copies_job_id"),
         )
 
-    if not _index_exists("recently_deleted_job_copies", "ix_recently_deleted_job_copies_destroy_after"):
+    if "ix_recently_deleted_job_copies_destroy_after" not in deleted_indexes:
         op.create_index(
             "ix_recently_deleted_job_copies_destroy_after",
             "recently_deleted_job_copies",
             ["destroy_after"],
             unique=False,
         )
-    if not _index_exists("recently_deleted_job_copies", "ix_recently_deleted_job_copies_deleted_at"):
+    if "ix_recently_deleted_job_copies_deleted_at" not in deleted_indexes:
         op.create_index(
             "ix_recently_deleted_job_copies_deleted_at",
             "recently_deleted_job_copies",
@@ -85,17 +88,21 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    if _table_exists("recently_deleted_job_copies"):
-        if _index_exists("recently_deleted_job_copies", "ix_recently_deleted_job_copies_deleted_at"):
+    insp = inspect(op.get_bind())
+    existing_tables = set(insp.get_table_names())
+    copy_indexes = _existing_indexes(insp, "job_copies", existing_tables)
+    deleted_indexes = _existing_indexes(insp, "recently_deleted_job_copies", existing_tables)
+
+    if "recently_deleted_job_copies" in existing_tables:
+        if "ix_recently_deleted_job_copies_deleted_at" in deleted_indexes:
             op.drop_index("ix_recently_deleted_job_copies_deleted_at", table_name="recently_deleted_job_copies")
-        if _index_exists("recently_deleted_job_copies", "ix_recently_deleted_job_copies_destroy_after"):
+        if "ix_recently_deleted_job_copies_destroy_after" in deleted_indexes:
             op.drop_index("ix_recently_deleted_job_copies_destroy_after", table_name="recently_deleted_job_copies")
         op.drop_table("recently_deleted_job_copies")
 
-    if _table_exists("job_copies"):
-        if _index_exists("job_copies", "ix_job_copies_created_at"):
+    if "job_copies" in existing_tables:
+        if "ix_job_copies_created_at" in copy_indexes:
             op.drop_index("ix_job_copies_created_at", table_name="job_copies")
-        if _index_exists("job_copies", "ix_job_copies_client_name"):
+        if "ix_job_copies_client_name" in copy_indexes:
             op.drop_index("ix_job_copies_client_name", table_name="job_copies")
         op.drop_table("job_copies")
-
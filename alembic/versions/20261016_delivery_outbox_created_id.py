@@ -0,0 +1,38 @@
+"""index delivery_outbox on (created_at, id) for keyset pagination
+
+Revision ID: 20261016_delivery_created_id
+Revises: 20261016_job_copies_client_trgm
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20261016_delivery_created_id"
+down_revision = "20261016_job_copies_client_trgm"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_delivery_outbox_created_at_id"
+
+
+def _existing_indexes(table_name: str) -> set[str]:
+    return {idx["name"] for idx in inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # Matches the listing ORDER BY created_at DESC, id DESC and its (created_at, id) < cursor range.
+    if INDEX_NAME not in _existing_indexes("delivery_outbox"):
+        op.create_index(
+            INDEX_NAME,
+            "delivery_outbox",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    if INDEX_NAME in _existing_indexes("delivery_outbox"):
+        op.drop_index(INDEX_NAME, table_name="delivery_outbox")
@@ -0,0 +1,52 @@
+"""index delivery_outbox for status-filtered, newest-first listings
+
+Revision ID: 20261016_delivery_outbox_indexes
+Revises: 20260320_job_inputs_client_key
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20261016_delivery_outbox_indexes"
+down_revision = "20260320_job_inputs_client_key"
+branch_labels = None
+depends_on = None
+
+PENDING_STATUSES = ("READY_TO_SEND", "COMPLETED_PENDING_SEND", "WAITING_FOR_SITE", "CHECKING_SITE")
+
+
+def _existing_indexes(table_name: str) -> set[str]:
+    return {idx["name"] for idx in inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    existing_idx = _existing_indexes("delivery_outbox")
+
+    if "ix_delivery_outbox_status_created_at" not in existing_idx:
+        op.create_index(
+            "ix_delivery_outbox_status_created_at",
+            "delivery_outbox",
+            ["status", sa.text("created_at DESC")],
+            unique=False,
+        )
+    if "ix_delivery_outbox_pending" not in existing_idx:
+        statuses = ", ".join(f"'{s}'" for s in PENDING_STATUSES)
+        op.create_index(
+            "ix_delivery_outbox_pending",
+            "delivery_outbox",
+            [sa.text("created_at DESC")],
+            unique=False,
+            postgresql_where=sa.text(f"status IN ({statuses})"),
+        )
+
+
+def downgrade() -> None:
+    existing_idx = _existing_indexes("delivery_outbox")
+
+    if "ix_delivery_outbox_pending" in existing_idx:
+        op.drop_index("ix_delivery_outbox_pending", table_name="delivery_outbox")
+    if "ix_delivery_outbox_status_created_at" in existing_idx:
+        op.drop_index("ix_delivery_outbox_status_created_at", table_name="delivery_outbox")
@@ -0,0 +1,52 @@
+"""extend the delivery_outbox status index with id for keyset pages
+
+Revision ID: 20261016_delivery_status_keyset
+Revises: 20261016_jsonb_path_ops
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20261016_delivery_status_keyset"
+down_revision = "20261016_jsonb_path_ops"
+branch_labels = None
+depends_on = None
+
+OLD_INDEX = "ix_delivery_outbox_status_created_at"
+NEW_INDEX = "ix_delivery_outbox_status_created_id"
+
+
+def _existing_indexes(table_name: str) -> set[str]:
+    return {idx["name"] for idx in inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # Status-filtered listings order by (created_at DESC, id DESC) and page with
+    # (created_at, id) < cursor; carrying id lets the index serve the full ORDER BY.
+    existing_idx = _existing_indexes("delivery_outbox")
+    if NEW_INDEX not in existing_idx:
+        op.create_index(
+            NEW_INDEX,
+            "delivery_outbox",
+            ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+        )
+    # Same leading columns; the new index covers everything the old one served.
+    if OLD_INDEX in existing_idx:
+        op.drop_index(OLD_INDEX, table_name="delivery_outbox")
+
+
+def downgrade() -> None:
+    existing_idx = _existing_indexes("delivery_outbox")
+    if OLD_INDEX not in existing_idx:
+        op.create_index(
+            OLD_INDEX,
+            "delivery_outbox",
+            ["status", sa.text("created_at DESC")],
+            unique=False,
+        )
+    if NEW_INDEX in existing_idx:
+        op.drop_index(NEW_INDEX, table_name="delivery_outbox")
@@ -0,0 +1,41 @@
+"""trigram index on job_copies.client_name for the admin client filter
+
+Revision ID: 20261016_job_copies_client_trgm
+Revises: 20261016_delivery_outbox_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20261016_job_copies_client_trgm"
+down_revision = "20261016_delivery_outbox_indexes"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_job_copies_client_name_trgm"
+
+
+def _existing_indexes(table_name: str) -> set[str]:
+    return {idx["name"] for idx in inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # list_job_copies filters with client_name ILIKE '%...%'; a btree cannot serve that,
+    # a pg_trgm GIN index can.
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    if INDEX_NAME not in _existing_indexes("job_copies"):
+        op.create_index(
+            INDEX_NAME,
+            "job_copies",
+            ["client_name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"client_name": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if INDEX_NAME in _existing_indexes("job_copies"):
+        op.drop_index(INDEX_NAME, table_name="job_copies")
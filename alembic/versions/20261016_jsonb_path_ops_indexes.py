@@ -0,0 +1,50 @@
+"""GIN(jsonb_path_ops) indexes on sitemap_data and copy_data
+
+Revision ID: 20261016_jsonb_path_ops
+Revises: 20261016_delivery_created_id
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy import inspect
+
+revision = "20261016_jsonb_path_ops"
+down_revision = "20261016_delivery_created_id"
+branch_labels = None
+depends_on = None
+
+# (index name, table, JSONB column)
+INDEXES = (
+    ("idx_job_sitemaps_data_gin", "job_sitemaps", "sitemap_data"),
+    ("idx_job_copies_data_gin", "job_copies", "copy_data"),
+)
+
+
+def _existing_indexes(table_name: str) -> set[str]:
+    return {idx["name"] for idx in inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # jsonb_path_ops serves @> containment at roughly half the size of the default jsonb_ops.
+    # Built concurrently so writers to these tables are not blocked while it runs.
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            if name in _existing_indexes(table):
+                continue
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _column in INDEXES:
+            if name in _existing_indexes(table):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
-from typing import Iterable
+from functools import lru_cache
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Query, Request
+from sqlalchemy import Row, Text, cast, func, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer
 from starlette.responses import HTMLResponse, RedirectResponse, Response
 
 from .auth import require_admin_auth
-from .db import get_db_session
+from .db import get_async_db_session, get_db_session
 from .db_models import DeliveryOutbox, JobCopy, RecentlyDeletedJobCopy
 from .copy_store import (
     SOFT_DELETE_HOURS_DEFAULT,
@@ -26,9 +26,9 @@ from .delivery_versions import (
     list_version_options_for_client,
     resolve_requested_version_job_id,
 )
+from .pagination import decode_cursor, fetch_keyset_page
 from .tasks import finalize_deleted_job_copy, send_delivery
-
-templates = Jinja2Templates(directory="templates")
+from .templating import templates
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -43,12 +43,26 @@ STATUS_OPTIONS = [
 ]
 
 
+@lru_cache(maxsize=8192)
+def _format_aware_dt(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
 def _format_dt(value: datetime | None) -> str:
     if value is None:
         return ""
     if value.tzinfo is None:
         value = value.replace(tzinfo=timezone.utc)
-    return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+    # Rows on a page share many timestamps; reuse the formatted string.
+    return _format_aware_dt(value)
+
+
+def _request_now(request: Request) -> datetime:
+    # One wall-clock read per request, shared by everything the handler stamps.
+    now = getattr(request.state, "now", None)
+    if now is None:
+        now = request.state.now = datetime.now(timezone.utc)
+    return now
 
 
 def _get_delivery(session: Session, delivery_id: UUID) -> DeliveryOutbox:
@@ -58,35 +72,79 @@ def _get_delivery(session: Session, delivery_id: UUID) -> DeliveryOutbox:
     return row
 
 
+def _update_delivery(session: Session, delivery_id: UUID, **values) -> DeliveryOutbox:
+    # UPDATE ... RETURNING replaces the get/commit/refresh sequence with one round-trip.
+    stmt = (
+        update(DeliveryOutbox)
+        .where(DeliveryOutbox.id == delivery_id)
+        .values(**values)
+        .returning(DeliveryOutbox)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    row = session.execute(stmt).scalar_one_or_none()
+    if row is None:
+        session.rollback()
+        raise HTTPException(status_code=404, detail="delivery not found")
+    session.commit()
+    return row
+
+
+# Columns rendered by the deliveries list; selecting them directly skips ORM hydration.
+_DELIVERY_LIST_COLUMNS = (
+    DeliveryOutbox.id,
+    DeliveryOutbox.job_id,
+    DeliveryOutbox.client_name,
+    DeliveryOutbox.status,
+    DeliveryOutbox.default_target_url,
+    DeliveryOutbox.override_target_url,
+    DeliveryOutbox.attempt_count,
+    DeliveryOutbox.last_error,
+    DeliveryOutbox.created_at,
+    DeliveryOutbox.updated_at,
+    DeliveryOutbox.sent_at,
+)
+
+
 def _list_deliveries(
     session: Session,
     status: str | None,
-    page: int,
+    before: tuple[datetime, UUID] | None,
     page_size: int,
-) -> tuple[list[DeliveryOutbox], int]:
-    filters: Iterable = []
+    with_total: bool = False,
+    after: tuple[datetime, UUID] | None = None,
+) -> tuple[list[Row], str | None, str | None, int | None]:
+    # Lambda statements cache their compiled form; only the bound values change per request.
+    stmt = lambda_stmt(lambda: select(*_DELIVERY_LIST_COLUMNS))
+    count_stmt = lambda_stmt(lambda: select(func.count()).select_from(DeliveryOutbox))
     if status:
-        filters = [DeliveryOutbox.status == status]
-
-    count_stmt = select(func.count()).select_from(DeliveryOutbox)
-    if status:
-        count_stmt = count_stmt.where(*filters)
-    total = session.execute(count_stmt).scalar_one()
-
-    stmt = select(DeliveryOutbox).order_by(DeliveryOutbox.created_at.desc())
-    if status:
-        stmt = stmt.where(*filters)
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-    rows = session.execute(stmt).scalars().all()
-    return rows, total
-
-
-def _delivery_version_data(session: Session, delivery: DeliveryOutbox) -> tuple[list[dict], str]:
-    client_key = delivery_client_key(
+        stmt += lambda s: s.where(DeliveryOutbox.status == status)
+        count_stmt += lambda s: s.where(DeliveryOutbox.status == status)
+    # Keyset on (created_at, id): each page costs the same regardless of depth.
+    return fetch_keyset_page(
         session,
-        job_id=delivery.job_id,
-        client_name=delivery.client_name,
+        stmt,
+        count_stmt=count_stmt,
+        keyset=(DeliveryOutbox.created_at, DeliveryOutbox.id),
+        before=before,
+        after=after,
+        page_size=page_size,
+        with_total=with_total,
+        scalars=False,
     )
+
+
+def _delivery_version_data(
+    session: Session,
+    delivery: DeliveryOutbox | Row,
+    *,
+    client_key: str | None = None,
+) -> tuple[list[dict], str]:
+    if client_key is None:
+        client_key = delivery_client_key(
+            session,
+            job_id=delivery.job_id,
+            client_name=delivery.client_name,
+        )
     options = list_version_options_for_client(session, client_key=client_key)
     default_job_id = options[0].job_id if options else ""
     return [opt.model_dump(mode="json") for opt in options], default_job_id
@@ -98,8 +156,9 @@ def _render_row(
     delivery: DeliveryOutbox,
     *,
     rerun_job_id: str | None = None,
+    client_key: str | None = None,
 ) -> HTMLResponse:
-    options, default_job_id = _delivery_version_data(session, delivery)
+    options, default_job_id = _delivery_version_data(session, delivery, client_key=client_key)
     return templates.TemplateResponse(
         "partials/delivery_row.html",
         {
@@ -131,11 +190,15 @@ def _render_deleted_copy_row(request: Request, copy: RecentlyDeletedJobCopy) ->
 def deliveries_page(
     request: Request,
     status: str | None = Query(default=None),
-    page: int = Query(default=1, ge=1),
+    before: str | None = Query(default=None),
+    after: str | None = Query(default=None),
     page_size: int = Query(default=50, ge=1, le=200),
+    with_total: bool = Query(default=False),
     session: Session = Depends(get_db_session),
 ):
-    rows, total = _list_deliveries(session, status, page, page_size)
+    rows, next_cursor, prev_cursor, total = _list_deliveries(
+        session, status, decode_cursor(before), page_size, with_total, after=decode_cursor(after)
+    )
     version_options_by_delivery_id: dict[str, list[dict]] = {}
     default_version_by_delivery_id: dict[str, str] = {}
     rerun_job_id_by_delivery_id: dict[str, str] = {}
@@ -146,19 +209,18 @@ def deliveries_page(
         default_version_by_delivery_id[did] = default_job_id
         rerun_job_id_by_delivery_id[did] = ""
 
-    has_prev = page > 1
-    has_next = page * page_size < total
     return templates.TemplateResponse(
         "admin_deliveries.html",
         {
             "request": request,
             "deliveries": rows,
             "status": status or "",
-            "page": page,
+            "before": before or "",
+            "after": after or "",
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
             "page_size": page_size,
             "total": total,
-            "has_prev": has_prev,
-            "has_next": has_next,
             "status_options": STATUS_OPTIONS,
             "format_dt": _format_dt,
             "version_options_by_delivery_id": version_options_by_delivery_id,
@@ -172,23 +234,30 @@ def deliveries_page(
 def copies_page(
     request: Request,
     client: str | None = Query(default=None),
-    page: int = Query(default=1, ge=1),
+    before: str | None = Query(default=None),
+    after: str | None = Query(default=None),
     page_size: int = Query(default=50, ge=1, le=200),
+    with_total: bool = Query(default=False),
 ):
-    rows, total = list_job_copies(client_substring=(client or "").strip() or None, page=page, page_size=page_size)
-    has_prev = page > 1
-    has_next = page * page_size < total
+    rows, next_cursor, prev_cursor, total = list_job_copies(
+        client_substring=(client or "").strip() or None,
+        before=decode_cursor(before),
+        after=decode_cursor(after),
+        page_size=page_size,
+        with_total=with_total,
+    )
     return templates.TemplateResponse(
         "admin_copies.html",
         {
             "request": request,
             "copies": rows,
             "client": client or "",
-            "page": page,
+            "before": before or "",
+            "after": after or "",
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
             "page_size": page_size,
             "total": total,
-            "has_prev": has_prev,
-            "has_next": has_next,
             "format_dt": _format_dt,
         },
     )
@@ -197,39 +266,46 @@ def copies_page(
 @router.get("/copies/recently-deleted", response_class=HTMLResponse, dependencies=[Depends(require_admin_auth)])
 def recently_deleted_copies_page(
     request: Request,
-    page: int = Query(default=1, ge=1),
+    before: str | None = Query(default=None),
+    after: str | None = Query(default=None),
     page_size: int = Query(default=50, ge=1, le=200),
+    with_total: bool = Query(default=False),
 ):
-    rows, total = list_recently_deleted_job_copies(page=page, page_size=page_size)
-    has_prev = page > 1
-    has_next = page * page_size < total
+    rows, next_cursor, prev_cursor, total = list_recently_deleted_job_copies(
+        before=decode_cursor(before),
+        after=decode_cursor(after),
+        page_size=page_size,
+        with_total=with_total,
+    )
     return templates.TemplateResponse(
         "admin_recently_deleted_copies.html",
         {
             "request": request,
             "copies": rows,
-            "page": page,
+            "before": before or "",
+            "after": after or "",
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
             "page_size": page_size,
             "total": total,
-            "has_prev": has_prev,
-            "has_next": has_next,
             "format_dt": _format_dt,
         },
     )
 
 
 @router.get("/copies/{job_id}", response_class=HTMLResponse, dependencies=[Depends(require_admin_auth)])
-def copy_view_page(
+async def copy_view_page(
     request: Request,
     job_id: str,
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     job_id = job_id.strip()
-    row = session.execute(select(JobCopy).where(JobCopy.job_id == job_id)).scalar_one_or_none()
+    stmt = select(JobCopy).options(undefer(JobCopy.copy_data)).where(JobCopy.job_id == job_id)
+    row = (await session.execute(stmt)).scalar_one_or_none()
     if row is None:
         raise HTTPException(status_code=404, detail="copy not found")
 
-    pretty = json.dumps(row.copy_data or {}, ensure_ascii=False, indent=2)
+    pretty = orjson.dumps(row.copy_data or {}, option=orjson.OPT_INDENT_2).decode("utf-8")
     return templates.TemplateResponse(
         "admin_copy_view.html",
         {
@@ -242,15 +318,17 @@ def copy_view_page(
 
 
 @router.get("/copies/{job_id}/download", dependencies=[Depends(require_admin_auth)])
-def copy_download(
+async def copy_download(
     job_id: str,
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     job_id = job_id.strip()
-    row = session.execute(select(JobCopy).where(JobCopy.job_id == job_id)).scalar_one_or_none()
-    if row is None:
+    # Let Postgres render the JSONB as text; skips decoding to dicts and re-encoding here.
+    body = (
+        await session.execute(select(cast(JobCopy.copy_data, Text)).where(JobCopy.job_id == job_id))
+    ).scalar_one_or_none()
+    if body is None:
         raise HTTPException(status_code=404, detail="copy not found")
-    body = json.dumps(row.copy_data or {}, ensure_ascii=False, separators=(",", ":"))
     filename = f"{job_id}.json"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
     return Response(content=body, media_type="application/json", headers=headers)
@@ -260,14 +338,19 @@ def copy_download(
 def copy_delete(
     request: Request,
     job_id: str,
+    background: BackgroundTasks,
 ):
     job_id = job_id.strip()
     deleted_id = soft_delete_job_copy(job_id=job_id)
     if deleted_id is None:
         raise HTTPException(status_code=404, detail="copy not found")
 
-    # Schedule the final destroy after the grace period.
-    finalize_deleted_job_copy.apply_async(args=[job_id], countdown=int(SOFT_DELETE_HOURS_DEFAULT * 3600))
+    # Schedule the final destroy after the grace period; publish after the redirect is sent.
+    background.add_task(
+        finalize_deleted_job_copy.apply_async,
+        args=[job_id],
+        countdown=int(SOFT_DELETE_HOURS_DEFAULT * 3600),
+    )
 
     # Redirect back to the list.
     return RedirectResponse(url="/admin/copies", status_code=303)
@@ -280,11 +363,8 @@ def override_url(
     override_target_url: str = Form(...),
     session: Session = Depends(get_db_session),
 ):
-    row = _get_delivery(session, delivery_id)
     value = override_target_url.strip()
-    row.override_target_url = value if value else None
-    session.commit()
-    session.refresh(row)
+    row = _update_delivery(session, delivery_id, override_target_url=value if value else None)
     return _render_row(request, session, row)
 
 
@@ -292,11 +372,12 @@ def override_url(
 def send_now(
     request: Request,
     delivery_id: UUID,
+    background: BackgroundTasks,
     session: Session = Depends(get_db_session),
 ):
-    _get_delivery(session, delivery_id)
-    send_delivery.delay(str(delivery_id))
     row = _get_delivery(session, delivery_id)
+    # The broker round-trip does not need to hold up the row render.
+    background.add_task(send_delivery.delay, str(delivery_id))
     return _render_row(request, session, row)
 
 
@@ -309,6 +390,7 @@ def _parse_replay_flag(value: str | None) -> bool:
 def send_version(
     request: Request,
     delivery_id: UUID,
+    background: BackgroundTasks,
     version_job_id: str = Form(default=""),
     replay: str = Form(default="0"),
     session: Session = Depends(get_db_session),
@@ -335,9 +417,10 @@ def send_version(
         if options:
             payload_ref_override = f"db:{options[0].job_id}"
 
-    send_delivery.delay(str(delivery_id), "pro", replay_requested, payload_ref_override)
-    row = _get_delivery(session, delivery_id)
-    return _render_row(request, session, row)
+    # Publish after the row is sent, as send-now does.
+    background.add_task(send_delivery.delay, str(delivery_id), "pro", replay_requested, payload_ref_override)
+    # Nothing changed in the DB synchronously; render the row and client key already in hand.
+    return _render_row(request, session, row, client_key=client_key)
 
 
 @router.post("/deliveries/{delivery_id}/rerun", response_class=HTMLResponse, dependencies=[Depends(require_admin_auth)])
@@ -385,10 +468,11 @@ def mark_ready(
     delivery_id: UUID,
     session: Session = Depends(get_db_session),
 ):
-    row = _get_delivery(session, delivery_id)
-    row.status = "READY_TO_SEND"
-    row.last_error = None
-    row.updated_at = datetime.now(timezone.utc)
-    session.commit()
-    session.refresh(row)
+    row = _update_delivery(
+        session,
+        delivery_id,
+        status="READY_TO_SEND",
+        last_error=None,
+        updated_at=_request_now(request),
+    )
     return _render_row(request, session, row)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import hmac
 import os
 
@@ -18,21 +19,21 @@ def require_bearer(authorization: str | None = Header(default=None)) -> None:
         raise HTTPException(status_code=403, detail="Invalid bearer token")
 
 
-def _parse_basic_auth(authorization: str) -> tuple[str, str]:
-    try:
-        scheme, encoded = authorization.split(" ", 1)
-    except ValueError:
+def _parse_basic_auth_password(authorization: str) -> bytes:
+    scheme, _, encoded = authorization.partition(" ")
+    if not encoded:
         raise HTTPException(status_code=401, detail="Invalid authorization header", headers={"WWW-Authenticate": "Basic"})
     if scheme.lower() != "basic":
         raise HTTPException(status_code=401, detail="Invalid auth scheme", headers={"WWW-Authenticate": "Basic"})
     try:
-        decoded = base64.b64decode(encoded).decode("utf-8")
-    except Exception:
+        decoded = base64.b64decode(encoded)
+    except (binascii.Error, ValueError):
         raise HTTPException(status_code=401, detail="Invalid auth encoding", headers={"WWW-Authenticate": "Basic"})
-    if ":" not in decoded:
+    # Any username is accepted; only the password bytes are compared.
+    _, sep, password = decoded.partition(b":")
+    if not sep:
         raise HTTPException(status_code=401, detail="Invalid auth format", headers={"WWW-Authenticate": "Basic"})
-    username, password = decoded.split(":", 1)
-    return username, password
+    return password
 
 
 def require_admin_auth(authorization: str | None = Header(default=None)) -> None:
@@ -41,6 +42,6 @@ def require_admin_auth(authorization: str | None = Header(default=None)) -> None
         raise HTTPException(status_code=500, detail="ADMIN_PASSWORD is missing")
     if not authorization:
         raise HTTPException(status_code=401, detail="Unauthorized", headers={"WWW-Authenticate": "Basic"})
-    _, password = _parse_basic_auth(authorization)
-    if not hmac.compare_digest(password, admin_password):
+    password = _parse_basic_auth_password(authorization)
+    if not hmac.compare_digest(password, admin_password.encode("utf-8")):
         raise HTTPException(status_code=403, detail="Forbidden")
@@ -1,9 +1,33 @@
 import os
+
+import orjson
 from celery import Celery
 from celery.schedules import crontab
+from kombu.serialization import register
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+
+def _orjson_default(obj):
+    raise TypeError(f"task argument of type {type(obj).__name__} is not orjson-serializable")
+
+
+def _orjson_dumps(obj) -> bytes:
+    # Non-str dict keys are stringified, as kombu's json serializer does.
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Task bodies (webhook payload dicts) are encoded with orjson. It has its own content
+# type: kombu keeps one decoder per content type, and application/json must stay with
+# the json serializer, which restores the datetimes/UUIDs it tags in messages and results.
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 celery_app = Celery(
     "pro_content_api",
     broker=REDIS_URL,
@@ -14,12 +38,16 @@ celery_app = Celery(
 celery_app.conf.update(
     timezone=os.getenv("CELERY_TIMEZONE", "America/Chicago"),
     enable_utc=False,
+    task_serializer="orjson",
+    accept_content=["json", "orjson"],
 
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     task_track_started=True,
     worker_prefetch_multiplier=1,
-    broker_transport_options={"visibility_timeout": 60 * 60 * 2},
+    broker_transport_options={"visibility_timeout": 60 * 60 * 2, "socket_keepalive": True},
+    # Web processes publish from request handlers; keep pooled broker connections warm.
+    broker_pool_limit=int(os.getenv("CELERY_BROKER_POOL_LIMIT", "10")),
 
     beat_schedule={
         "monthly-queue-logs-upload": {
@@ -1,24 +1,27 @@
 from __future__ import annotations
 import logging
 import re
-from typing import Any, Dict, List, Optional
-
-from .models import (
-    CampaignPageItem,
-    FinalCopyOutput,
-    HomePayload,
-    AboutPayload,
-    SEOPageItem,
-    UtilityPageOutput,
-)
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from .models import CampaignPageItem, FinalCopyOutput
 
 logger = logging.getLogger(__name__)
 
 _SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Byte table for the ASCII fast path: keep a-z/0-9, turn everything else into "-".
+_SLUG_ASCII_TABLE = bytes(c if (48 <= c <= 57 or 97 <= c <= 122) else 45 for c in range(256))
 
 
 def _clean_str(value: Any) -> str:
-    return str(value).strip() if value is not None else ""
+    # Nearly every envelope field is already a str; skip the str() call for those.
+    if type(value) is str:
+        return value.strip()
+    if value is None:
+        return ""
+    return str(value).strip()
 
 
 def _string_or_empty(value: Any) -> str:
@@ -29,10 +32,17 @@ def _non_empty_str(value: Any) -> bool:
     return isinstance(value, str) and value.strip() != ""
 
 
+@lru_cache(maxsize=4096)
+def _slugify_str(text: str) -> str:
+    if text.isascii():
+        dashed = text.encode("ascii").translate(_SLUG_ASCII_TABLE).decode("ascii")
+        return "-".join(part for part in dashed.split("-") if part)
+    return _SLUG_RE.sub("-", text).strip("-")
+
+
 def _slugify(value: Any) -> str:
-    text = _clean_str(value).lower()
-    text = _SLUG_RE.sub("-", text)
-    return text.strip("-")
+    # The same titles are slugified several times per batch; cache on the cleaned string.
+    return _slugify_str(_clean_str(value).lower())
 
 
 def _first_non_empty(*values: Any) -> str:
@@ -48,29 +58,34 @@ def _sanitize_page_title(payload: Dict[str, Any]) -> None:
         payload.pop("page_title", None)
 
 
-def _drop_page_title_if_none(container: Dict[str, Any]) -> None:
-    if "page_title" in container and container.get("page_title") is None:
-        container.pop("page_title", None)
+def _none_page_title_exclude(final: FinalCopyOutput) -> Dict[str, Any]:
+    # Compile output omits an unset page_title rather than emitting null; other dumps of
+    # these models keep it. The omission itself happens inside the model_dump.
+    exclude: Dict[str, Any] = {}
+    if final.home.page_title is None:
+        exclude["home"] = {"page_title"}
+    if final.about.page_title is None:
+        exclude["about"] = {"page_title"}
+    seo_pages = {i: {"page_title"} for i, page in enumerate(final.seo_pages) if page.page_title is None}
+    if seo_pages:
+        exclude["seo_pages"] = seo_pages
+    return exclude
+
+
+_SEO_PATH_PREFIXES: Mapping[str, str] = MappingProxyType(
+    {
+        "service": "/services/",
+        "seo-service": "/services/",
+        "industry": "/industries/",
+        "seo-industry": "/industries/",
+        "location": "/locations/",
+        "seo-location": "/locations/",
+    }
+)
 
 
 def _seo_path_prefix(seo_page_type: Any) -> str:
-    t = _clean_str(seo_page_type).lower()
-    mapping = {
-        "service": "service",
-        "seo-service": "service",
-        "industry": "industry",
-        "seo-industry": "industry",
-        "location": "location",
-        "seo-location": "location",
-    }
-    normalized = mapping.get(t)
-    if normalized == "service":
-        return "/services/"
-    if normalized == "industry":
-        return "/industries/"
-    if normalized == "location":
-        return "/locations/"
-    return "/pages/"
+    return _SEO_PATH_PREFIXES.get(_clean_str(seo_page_type).lower(), "/pages/")
 
 
 def _derive_seo_path(payload: Dict[str, Any]) -> str:
@@ -106,25 +121,24 @@ def _derive_skip_path(this_page: Dict[str, Any]) -> str:
     return f"/skipped/{slug}"
 
 
+_UTILITY_CONTENT_PAGE_TYPES = frozenset({"about-why", "about-team"})
+
+
 def _is_utility_payload(payload: Dict[str, Any]) -> bool:
-    cpt = _clean_str(payload.get("content_page_type"))
-    return cpt in {"about-why", "about-team"}
+    return _clean_str(payload.get("content_page_type")) in _UTILITY_CONTENT_PAGE_TYPES
 
 
-def _extract_utility_source(env: Dict[str, Any]) -> tuple[Dict[str, Any], str] | None:
-    kind = _clean_str(env.get("page_kind"))
+def _extract_utility_source(env: Dict[str, Any], kind: str) -> tuple[Dict[str, Any], str] | None:
+    nested = env.get("utility_page")
+    if not isinstance(nested, dict):
+        nested = None
     if kind == "utility_page":
-        src = env.get("utility_page") if isinstance(env.get("utility_page"), dict) else env
-        page_path = _string_or_empty(src.get("path")) or _string_or_empty(env.get("path"))
-        return src, page_path
+        src = nested if nested is not None else env
+        return src, _string_or_empty(src.get("path")) or _string_or_empty(env.get("path"))
     if _is_utility_payload(env):
-        src = env
-        page_path = _string_or_empty(src.get("path"))
-        return src, page_path
-    utility_payload = env.get("utility_page")
-    if isinstance(utility_payload, dict) and _is_utility_payload(utility_payload):
-        page_path = _string_or_empty(utility_payload.get("path")) or _string_or_empty(env.get("path"))
-        return utility_payload, page_path
+        return env, _string_or_empty(env.get("path"))
+    if nested is not None and _is_utility_payload(nested):
+        return nested, _string_or_empty(nested.get("path")) or _string_or_empty(env.get("path"))
     return None
 
 
@@ -181,6 +195,13 @@ def _build_about_content(src: Dict[str, Any], page_title: str) -> Dict[str, Any]
     }
 
 
+def _pad_about_values(items: List[Any]) -> List[Any]:
+    # Always exactly four slots; never mutates the caller's list.
+    if len(items) >= 4:
+        return items[:4]
+    return items + [{"heading": "", "content": ""} for _ in range(4 - len(items))]
+
+
 def _build_about_values(src: Dict[str, Any]) -> Dict[str, Any]:
     values = src.get("about_values")
     values = values if isinstance(values, dict) else {}
@@ -199,13 +220,10 @@ def _build_about_values(src: Dict[str, Any]) -> Dict[str, Any]:
                 )
             if len(items) == 4:
                 break
-    while len(items) < 4:
-        items.append({"heading": "", "content": ""})
-
     return {
         "title": _string_or_empty(values.get("title")),
         "subtitle": _string_or_empty(values.get("subtitle")),
-        "about_values_content": items,
+        "about_values_content": _pad_about_values(items),
     }
 
 
@@ -248,27 +266,8 @@ def _build_utility_page(src: Dict[str, Any], page_path: str) -> Dict[str, Any]:
     else:
         content_payload = _build_about_content(src, page_title)
 
-    about_values = src.get("about_values")
     values_payload = _build_about_values(src)
-    if isinstance(about_values, dict):
-        items = about_values.get("about_values_content") or []
-        if not isinstance(items, list):
-            items = []
-        while len(items) < 4:
-            items.append({"heading": "", "content": ""})
-        values_payload = {
-            "title": _string_or_empty(about_values.get("title")),
-            "subtitle": _string_or_empty(about_values.get("subtitle")),
-            "about_values_content": items[:4],
-        }
-
-    about_cta = src.get("about_cta")
     cta_payload = _build_about_cta(src)
-    if isinstance(about_cta, dict):
-        cta_payload = {
-            "title": _string_or_empty(about_cta.get("title")),
-            "content": _string_or_empty(about_cta.get("content")),
-        }
     return {
         "page_id": None,
         "page_title": page_title,
@@ -281,14 +280,6 @@ def _build_utility_page(src: Dict[str, Any], page_path: str) -> Dict[str, Any]:
     }
 
 
-def _upsert_utility_page(pages: List[UtilityPageOutput], page: UtilityPageOutput) -> None:
-    for idx, existing in enumerate(pages):
-        if existing.slug == page.slug:
-            pages[idx] = page
-            return
-    pages.append(page)
-
-
 def _resolve_path(kind: str, env: Dict[str, Any], payload: Dict[str, Any]) -> str:
     this_page = env.get("this_page")
     if not isinstance(this_page, dict):
@@ -311,6 +302,17 @@ def _resolve_path(kind: str, env: Dict[str, Any], payload: Dict[str, Any]) -> st
     return ""
 
 
+# Envelope kinds whose body sits under env[kind] and is compiled as-is.
+_PAGE_KINDS = ("home", "about", "seo_page")
+
+
+def _page_payload(kind: str, env: Dict[str, Any]) -> Dict[str, Any]:
+    payload = dict(env.get(kind) or {})
+    _sanitize_page_title(payload)
+    payload["path"] = _resolve_path(kind, env, payload)
+    return payload
+
+
 def _validate_final_paths(final: FinalCopyOutput) -> None:
     home_path = _clean_str(final.home.path)
     if not home_path:
@@ -323,14 +325,14 @@ def _validate_final_paths(final: FinalCopyOutput) -> None:
     if about_path != "/about":
         raise ValueError(f"about path must be '/about', got '{final.about.path}'")
 
-    seo_paths: List[str] = []
+    path_counts: Counter[str] = Counter()
     for idx, page in enumerate(final.seo_pages):
         path = _clean_str(page.path)
         if not path:
             raise ValueError(f"seo_pages[{idx}] missing path")
-        seo_paths.append(path)
-    if len(seo_paths) != len(set(seo_paths)):
-        duplicates = sorted({p for p in seo_paths if seo_paths.count(p) > 1})
+        path_counts[path] += 1
+    duplicates = sorted(p for p, count in path_counts.items() if count > 1)
+    if duplicates:
         raise ValueError(f"duplicate seo_page paths: {duplicates}")
 
 
@@ -343,15 +345,15 @@ def compile_final(
     { home, about, seo_pages, utility_pages, campaign_pages }
     Missing pages remain defaults.
     """
-    final = FinalCopyOutput()
+    payloads_by_kind: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in _PAGE_KINDS}
+    # Keyed by slug; a later page with the same slug replaces the earlier one in place.
+    utility_payloads: Dict[str, Dict[str, Any]] = {}
 
     for env in page_envelopes:
         if not env:
             continue
-        if isinstance(env, dict):
-            utility_source = _extract_utility_source(env)
-        else:
-            utility_source = None
+        kind = _clean_str(env.get("page_kind"))
+        utility_source = _extract_utility_source(env, kind) if isinstance(env, dict) else None
         if utility_source is not None:
             src, page_path = utility_source
             src_page_title = src.get("page_title")
@@ -359,31 +361,25 @@ def compile_final(
                 log_path = page_path or f"/{_slugify(src_page_title)}"
                 logger.info("utility_page.page_title preserved for %s", log_path)
             utility_payload = _build_utility_page(src, page_path)
-            _upsert_utility_page(final.utility_pages, UtilityPageOutput.model_validate(utility_payload))
+            utility_payloads[utility_payload["slug"]] = utility_payload
             continue
-        kind = _clean_str(env.get("page_kind"))
-        if kind == "home" and "home" in env:
-            payload = dict(env.get("home") or {})
-            _sanitize_page_title(payload)
-            payload["path"] = _resolve_path(kind, env, payload)
-            final.home = HomePayload.model_validate(payload)
-        elif kind == "about" and "about" in env:
-            payload = dict(env.get("about") or {})
-            _sanitize_page_title(payload)
-            payload["path"] = _resolve_path(kind, env, payload)
-            final.about = AboutPayload.model_validate(payload)
-        elif kind == "seo_page" and "seo_page" in env:
-            payload = dict(env.get("seo_page") or {})
-            _sanitize_page_title(payload)
-            payload["path"] = _resolve_path(kind, env, payload)
-            final.seo_pages.append(SEOPageItem.model_validate(payload))
-        else:
-            # skip or unknown
-            pass
-
-    if campaign_pages:
-        for item in campaign_pages:
-            final.campaign_pages.append(CampaignPageItem.model_validate(item))
+        bucket = payloads_by_kind.get(kind)
+        # skip, unknown kinds, and envelopes missing their page body fall through
+        if bucket is not None and kind in env:
+            bucket.append(_page_payload(kind, env))
+
+    # Envelopes only collect plain dicts; the whole result is validated in one pass.
+    home_payloads = payloads_by_kind["home"]
+    about_payloads = payloads_by_kind["about"]
+    final = FinalCopyOutput.model_validate(
+        {
+            "home": home_payloads[-1] if home_payloads else {},
+            "about": about_payloads[-1] if about_payloads else {},
+            "seo_pages": payloads_by_kind["seo_page"],
+            "utility_pages": list(utility_payloads.values()),
+            "campaign_pages": list(campaign_pages or []),
+        }
+    )
 
     if not _clean_str(final.home.path):
         final.home.path = "/"
@@ -392,12 +388,5 @@ def compile_final(
     _validate_final_paths(final)
 
     # Enforce final strict schema
-    output = final.model_dump(by_alias=True)
-    if isinstance(output.get("home"), dict):
-        _drop_page_title_if_none(output["home"])
-    if isinstance(output.get("about"), dict):
-        _drop_page_title_if_none(output["about"])
-    for page in output.get("seo_pages") or []:
-        if isinstance(page, dict):
-            _drop_page_title_if_none(page)
+    output = final.model_dump(by_alias=True, exclude=_none_page_title_exclude(final))
     return {"data": {"content": output}}
@@ -3,14 +3,16 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, List, Tuple
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, literal, select
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import defer
 
 from .client_identity import build_client_key
-from .db import get_sessionmaker
+from .db import session_scope
 from .db_models import JobCopy, RecentlyDeletedJobCopy
+from .pagination import fetch_keyset_page
 
 logger = logging.getLogger(__name__)
 
@@ -50,29 +52,21 @@ def upsert_job_copy(
         .returning(JobCopy.id)
     )
 
-    session_factory = get_sessionmaker()
-    session = session_factory()
-    try:
-        row_id = session.execute(stmt).scalar_one_or_none()
-        session.commit()
-        logger.info("job_copy_upsert_ok job_id=%s copy_id=%s", job_id, str(row_id) if row_id else "")
-        return row_id
-    except Exception as exc:
-        session.rollback()
-        logger.exception("job_copy_upsert_failed job_id=%s err=%s", job_id, exc)
-        raise
-    finally:
-        session.close()
+    with session_scope() as session:
+        try:
+            row_id = session.execute(stmt).scalar_one_or_none()
+            session.commit()
+        except Exception as exc:
+            logger.exception("job_copy_upsert_failed job_id=%s err=%s", job_id, exc)
+            raise
+    logger.info("job_copy_upsert_ok job_id=%s copy_id=%s", job_id, str(row_id) if row_id else "")
+    return row_id
 
 
 def get_job_copy_data(job_id: str) -> Dict[str, Any] | None:
-    session_factory = get_sessionmaker()
-    session = session_factory()
-    try:
+    with session_scope() as session:
         row = session.execute(select(JobCopy.copy_data).where(JobCopy.job_id == job_id)).scalar_one_or_none()
-        return row if isinstance(row, dict) else None
-    finally:
-        session.close()
+    return row if isinstance(row, dict) else None
 
 
 def soft_delete_job_copy(
@@ -85,52 +79,53 @@ def soft_delete_job_copy(
 
     Returns the recently-deleted row id when successful, or None if the job copy does not exist.
     """
-    session_factory = get_sessionmaker()
-    session = session_factory()
-    try:
-        row = session.execute(select(JobCopy).where(JobCopy.job_id == job_id)).scalar_one_or_none()
-        if row is None:
-            return None
-
-        now = datetime.now(timezone.utc)
-        destroy_at = destroy_after or (now + timedelta(hours=SOFT_DELETE_HOURS_DEFAULT))
-
-        stmt = (
-            insert(RecentlyDeletedJobCopy)
-            .values(
-                job_id=row.job_id,
-                client_name=row.client_name,
-                copy_data=row.copy_data or {},
-                deleted_at=now,
-                destroy_after=destroy_at,
-            )
-            .on_conflict_do_update(
-                index_elements=[RecentlyDeletedJobCopy.job_id],
-                set_={
-                    "client_name": row.client_name,
-                    "copy_data": row.copy_data or {},
-                    "deleted_at": now,
-                    "destroy_after": destroy_at,
-                },
-            )
-            .returning(RecentlyDeletedJobCopy.id)
-        )
-        deleted_id = session.execute(stmt).scalar_one_or_none()
-        session.execute(delete(JobCopy).where(JobCopy.job_id == job_id))
-        session.commit()
-        logger.info(
-            "job_copy_soft_deleted job_id=%s deleted_id=%s destroy_after=%s",
-            job_id,
-            str(deleted_id) if deleted_id else "",
-            destroy_at.isoformat(),
-        )
-        return deleted_id
-    except Exception as exc:
-        session.rollback()
-        logger.exception("job_copy_soft_delete_failed job_id=%s err=%s", job_id, exc)
-        raise
-    finally:
-        session.close()
+    now = datetime.now(timezone.utc)
+    destroy_at = destroy_after or (now + timedelta(hours=SOFT_DELETE_HOURS_DEFAULT))
+
+    # DELETE ... RETURNING feeds the INSERT directly, so the move is one statement
+    # and the copy payload never travels to Python.
+    deleted_copy = (
+        delete(JobCopy)
+        .where(JobCopy.job_id == job_id)
+        .returning(JobCopy.job_id, JobCopy.client_name, JobCopy.copy_data)
+        .cte("deleted_copy")
+    )
+    stmt = insert(RecentlyDeletedJobCopy).from_select(
+        ["job_id", "client_name", "copy_data", "deleted_at", "destroy_after"],
+        select(
+            deleted_copy.c.job_id,
+            deleted_copy.c.client_name,
+            deleted_copy.c.copy_data,
+            literal(now, RecentlyDeletedJobCopy.deleted_at.type),
+            literal(destroy_at, RecentlyDeletedJobCopy.destroy_after.type),
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RecentlyDeletedJobCopy.job_id],
+        set_={
+            "client_name": stmt.excluded.client_name,
+            "copy_data": stmt.excluded.copy_data,
+            "deleted_at": stmt.excluded.deleted_at,
+            "destroy_after": stmt.excluded.destroy_after,
+        },
+    ).returning(RecentlyDeletedJobCopy.id)
+
+    with session_scope() as session:
+        try:
+            deleted_id = session.execute(stmt).scalar_one_or_none()
+            session.commit()
+        except Exception as exc:
+            logger.exception("job_copy_soft_delete_failed job_id=%s err=%s", job_id, exc)
+            raise
+    if deleted_id is None:
+        return None
+    logger.info(
+        "job_copy_soft_deleted job_id=%s deleted_id=%s destroy_after=%s",
+        job_id,
+        str(deleted_id),
+        destroy_at.isoformat(),
+    )
+    return deleted_id
 
 
 def finalize_soft_deleted_job_copy(job_id: str) -> bool:
@@ -139,70 +134,69 @@ def finalize_soft_deleted_job_copy(job_id: str) -> bool:
 
     Returns True if the row was deleted or doesn't exist.
     """
-    session_factory = get_sessionmaker()
-    session = session_factory()
-    try:
-        row = session.execute(
-            select(RecentlyDeletedJobCopy).where(RecentlyDeletedJobCopy.job_id == job_id)
+    now = datetime.now(timezone.utc)
+    with session_scope() as session:
+        deleted_id = session.execute(
+            delete(RecentlyDeletedJobCopy)
+            .where(
+                RecentlyDeletedJobCopy.job_id == job_id,
+                RecentlyDeletedJobCopy.destroy_after <= now,
+            )
+            .returning(RecentlyDeletedJobCopy.id)
         ).scalar_one_or_none()
-        if row is None:
+        if deleted_id is not None:
+            session.commit()
             return True
-        now = datetime.now(timezone.utc)
-        if row.destroy_after and row.destroy_after > now:
-            # Not due yet; caller can re-schedule.
-            return False
-        session.execute(delete(RecentlyDeletedJobCopy).where(RecentlyDeletedJobCopy.job_id == job_id))
-        session.commit()
-        return True
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+        # Nothing due: either already gone, or still inside the grace period (caller can re-schedule).
+        pending = session.execute(
+            select(RecentlyDeletedJobCopy.id).where(RecentlyDeletedJobCopy.job_id == job_id)
+        ).scalar_one_or_none()
+        return pending is None
 
 
 def list_job_copies(
     *,
     client_substring: str | None = None,
-    page: int = 1,
+    before: tuple[datetime, uuid.UUID] | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None,
     page_size: int = 50,
-) -> Tuple[List[JobCopy], int]:
-    session_factory = get_sessionmaker()
-    session = session_factory()
-    try:
-        filters: Iterable = []
-        if client_substring:
-            filters = [JobCopy.client_name.ilike(f"%{client_substring}%")]
-
-        count_stmt = select(func.count()).select_from(JobCopy)
-        if filters:
-            count_stmt = count_stmt.where(*filters)
-        total = session.execute(count_stmt).scalar_one()
-
-        stmt = select(JobCopy).order_by(JobCopy.created_at.desc())
-        if filters:
-            stmt = stmt.where(*filters)
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        rows = session.execute(stmt).scalars().all()
-        return rows, int(total or 0)
-    finally:
-        session.close()
+    with_total: bool = False,
+) -> Tuple[List[JobCopy], str | None, str | None, int | None]:
+    filters: list = []
+    if client_substring:
+        filters.append(JobCopy.client_name.ilike(f"%{client_substring}%"))
+
+    # The listing never shows the payload; leave the JSONB blob on the server.
+    stmt = select(JobCopy).options(defer(JobCopy.copy_data, raiseload=True)).where(*filters)
+    with session_scope() as session:
+        return fetch_keyset_page(
+            session,
+            stmt,
+            count_stmt=select(func.count()).select_from(JobCopy).where(*filters),
+            keyset=(JobCopy.created_at, JobCopy.id),
+            before=before,
+            after=after,
+            page_size=page_size,
+            with_total=with_total,
+        )
 
 
 def list_recently_deleted_job_copies(
     *,
-    page: int = 1,
+    before: tuple[datetime, uuid.UUID] | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None,
     page_size: int = 50,
-) -> Tuple[List[RecentlyDeletedJobCopy], int]:
-    session_factory = get_sessionmaker()
-    session = session_factory()
-    try:
-        count_stmt = select(func.count()).select_from(RecentlyDeletedJobCopy)
-        total = session.execute(count_stmt).scalar_one()
-
-        stmt = select(RecentlyDeletedJobCopy).order_by(RecentlyDeletedJobCopy.deleted_at.desc())
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        rows = session.execute(stmt).scalars().all()
-        return rows, int(total or 0)
-    finally:
-        session.close()
+    with_total: bool = False,
+) -> Tuple[List[RecentlyDeletedJobCopy], str | None, str | None, int | None]:
+    stmt = select(RecentlyDeletedJobCopy).options(defer(RecentlyDeletedJobCopy.copy_data, raiseload=True))
+    with session_scope() as session:
+        return fetch_keyset_page(
+            session,
+            stmt,
+            count_stmt=select(func.count()).select_from(RecentlyDeletedJobCopy),
+            keyset=(RecentlyDeletedJobCopy.deleted_at, RecentlyDeletedJobCopy.id),
+            before=before,
+            after=after,
+            page_size=page_size,
+            with_total=with_total,
+        )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import os
-from typing import Generator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Generator, Iterator
 
+import orjson
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 
@@ -26,14 +29,40 @@ class Base(DeclarativeBase):
     pass
 
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+# psycopg 3 server-side PREPAREs a statement after this many executions on a connection.
+DB_PREPARE_THRESHOLD = int(os.getenv("DB_PREPARE_THRESHOLD", "5"))
+
+
+def _json_serializer(value) -> str:
+    # JSONB binds (job copies, sitemaps, inputs) go through orjson instead of stdlib json.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def _engine_kwargs() -> dict:
+    return {
+        "pool_pre_ping": True,
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "connect_args": {"prepare_threshold": DB_PREPARE_THRESHOLD},
+    }
+
+
 _engine = None
 _session_factory = None
+_async_engine = None
+_async_session_factory = None
 
 
 def get_engine():
     global _engine
     if _engine is None:
-        _engine = create_engine(get_database_url(), pool_pre_ping=True)
+        _engine = create_engine(get_database_url(), **_engine_kwargs())
     return _engine
 
 
@@ -44,9 +73,42 @@ def get_sessionmaker():
     return _session_factory
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Session for store helpers: rolls back on error and always closes; callers commit."""
+    session = get_sessionmaker()()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def get_db_session() -> Generator[Session, None, None]:
     session = get_sessionmaker()()
     try:
         yield session
     finally:
         session.close()
+
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        # psycopg 3 serves both sync and async, so the same URL works here.
+        _async_engine = create_async_engine(get_database_url(), **_engine_kwargs())
+    return _async_engine
+
+
+def get_async_sessionmaker():
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(bind=get_async_engine(), expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as session:
+        yield session
@@ -46,7 +46,8 @@ class JobSitemap(Base):
     source: Mapped[str] = mapped_column(String, nullable=False, default="generated", server_default="generated")
     stamp: Mapped[str | None] = mapped_column(String, nullable=True)
     rows_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
-    sitemap_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    # JSONB payloads load only when asked for (undefer / direct column select).
+    sitemap_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, deferred=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -63,7 +64,7 @@ class JobCopy(Base):
     job_id: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     client_name: Mapped[str] = mapped_column(String, nullable=False)
     client_key: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
-    copy_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    copy_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, deferred=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -97,6 +98,6 @@ class RecentlyDeletedJobCopy(Base):
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     job_id: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     client_name: Mapped[str] = mapped_column(String, nullable=False)
-    copy_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    copy_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, deferred=True)
     deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     destroy_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
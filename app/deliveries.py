@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
+from starlette.responses import StreamingResponse
 
-from .db import get_db_session
+from .db import get_db_session, session_scope
 from .db_models import DeliveryOutbox
 from .delivery_schemas import (
     DeliveryListResponse,
@@ -16,57 +20,164 @@ from .delivery_schemas import (
     ScheduleRequest,
     SendNowResponse,
 )
+from .pagination import decode_cursor, fetch_keyset_page
 from .tasks import send_delivery
 
 router = APIRouter(prefix="/deliveries", tags=["deliveries"])
 
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 200
+EXPORT_BATCH_SIZE = 500
+DELIVERY_CACHE_SIZE = 4096
 
+# (field, default) pairs of the list item schema; column rows are copied into plain dicts,
+# which the route's response_model then validates and filters.
+_DELIVERY_ITEM_FIELDS = tuple((name, field.default) for name, field in DeliveryOutboxSchema.model_fields.items())
 
-def _get_delivery(session: Session, delivery_id: UUID) -> DeliveryOutbox:
-    row = session.get(DeliveryOutbox, delivery_id)
+
+# Every schema field that is a mapped column; website_tier is schema-only and keeps its default.
+_DELIVERY_ITEM_COLUMNS = tuple(
+    getattr(DeliveryOutbox, name) for name, _default in _DELIVERY_ITEM_FIELDS if name in DeliveryOutbox.__table__.c
+)
+
+
+def _delivery_item(row) -> dict:
+    return {name: getattr(row, name, default) for name, default in _DELIVERY_ITEM_FIELDS}
+
+
+# delivery id -> (updated_at, validated item) for GET polling. Every write moves updated_at
+# (onupdate=now(), in this process or a worker), so an entry is only served while it still
+# matches the row; this router's own writes also evict it outright.
+_delivery_cache: OrderedDict[UUID, tuple[datetime, DeliveryOutboxSchema]] = OrderedDict()
+_delivery_cache_lock = threading.Lock()
+
+
+def _cached_delivery(delivery_id: UUID, updated_at: datetime) -> DeliveryOutboxSchema | None:
+    with _delivery_cache_lock:
+        entry = _delivery_cache.get(delivery_id)
+        if entry is None or entry[0] != updated_at:
+            return None
+        _delivery_cache.move_to_end(delivery_id)
+        return entry[1]
+
+
+def _cache_delivery(item: DeliveryOutboxSchema) -> None:
+    with _delivery_cache_lock:
+        _delivery_cache[item.id] = (item.updated_at, item)
+        _delivery_cache.move_to_end(item.id)
+        if len(_delivery_cache) > DELIVERY_CACHE_SIZE:
+            _delivery_cache.popitem(last=False)
+
+
+def _evict_delivery(delivery_id: UUID) -> None:
+    with _delivery_cache_lock:
+        _delivery_cache.pop(delivery_id, None)
+
+
+def _ensure_delivery_exists(session: Session, delivery_id: UUID) -> None:
+    # Primary-key probe only; nothing from the row is needed.
+    found = session.execute(select(DeliveryOutbox.id).where(DeliveryOutbox.id == delivery_id)).scalar_one_or_none()
+    if found is None:
+        raise HTTPException(status_code=404, detail="delivery not found")
+
+
+def _update_delivery(session: Session, delivery_id: UUID, **values) -> dict:
+    # One UPDATE ... RETURNING in place of get / commit / refresh.
+    stmt = (
+        update(DeliveryOutbox)
+        .where(DeliveryOutbox.id == delivery_id)
+        .values(**values)
+        .returning(*_DELIVERY_ITEM_COLUMNS)
+    )
+    row = session.execute(stmt).one_or_none()
     if row is None:
+        session.rollback()
         raise HTTPException(status_code=404, detail="delivery not found")
-    return row
+    session.commit()
+    _evict_delivery(delivery_id)
+    return _delivery_item(row)
 
 
 @router.get("", response_model=DeliveryListResponse)
 def list_deliveries(
     status: str | None = Query(default=None),
-    page: int = Query(default=1, ge=1),
+    before: str | None = Query(default=None),
+    page: int | None = Query(
+        default=None,
+        ge=1,
+        deprecated=True,
+        description="Deprecated OFFSET paging, used only when `before` is absent; follow `next_cursor` instead.",
+    ),
     page_size: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    with_total: bool = Query(default=True),
     session: Session = Depends(get_db_session),
 ):
     filters = []
     if status:
         filters.append(DeliveryOutbox.status == status)
 
-    count_stmt = select(func.count()).select_from(DeliveryOutbox)
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-    total = session.execute(count_stmt).scalar_one()
-
-    stmt = select(DeliveryOutbox)
-    if filters:
-        stmt = stmt.where(*filters)
-    stmt = stmt.order_by(DeliveryOutbox.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-    items = session.execute(stmt).scalars().all()
-
-    return DeliveryListResponse(
-        items=[DeliveryOutboxSchema.model_validate(item) for item in items],
-        page=page,
+    # Keyset on (created_at, id): every page is an index range scan, however deep.
+    cursor = decode_cursor(before)
+    offset = (page - 1) * page_size if cursor is None and page is not None else 0
+    # Plain column rows: the listing is read-only, so skip ORM identity-map hydration.
+    items, next_cursor, _prev_cursor, total = fetch_keyset_page(
+        session,
+        select(*_DELIVERY_ITEM_COLUMNS).where(*filters),
+        count_stmt=select(func.count()).select_from(DeliveryOutbox).where(*filters),
+        keyset=(DeliveryOutbox.created_at, DeliveryOutbox.id),
+        before=cursor,
         page_size=page_size,
-        total=total,
-        status_filter=status,
+        with_total=with_total,
+        scalars=False,
+        offset=offset,
     )
 
+    return {
+        "items": [_delivery_item(item) for item in items],
+        # Page numbers are unknown once a cursor is followed.
+        "page": None if cursor is not None else (page or 1),
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+        "total": total,
+        "status_filter": status,
+    }
+
+
+@router.get("/export")
+def export_deliveries(status: str | None = Query(default=None)):
+    stmt = select(DeliveryOutbox).order_by(DeliveryOutbox.created_at.desc(), DeliveryOutbox.id.desc())
+    if status:
+        stmt = stmt.where(DeliveryOutbox.status == status)
+    stmt = stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    def _ndjson():
+        # Own session: the request-scoped one is closed before a streamed body is sent.
+        # yield_per streams from a server-side cursor, one batch of rows in memory at a time.
+        with session_scope() as session:
+            for batch in session.scalars(stmt).partitions():
+                yield b"".join(orjson.dumps(_delivery_item(row), option=orjson.OPT_UTC_Z) + b"\n" for row in batch)
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
 
 @router.get("/{delivery_id}", response_model=DeliveryOutboxSchema)
 def get_delivery(delivery_id: UUID, session: Session = Depends(get_db_session)):
-    row = _get_delivery(session, delivery_id)
-    return DeliveryOutboxSchema.model_validate(row)
+    # Primary-key probe for updated_at first; repeat polls of an unchanged row stop there.
+    updated_at = session.execute(
+        select(DeliveryOutbox.updated_at).where(DeliveryOutbox.id == delivery_id)
+    ).scalar_one_or_none()
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="delivery not found")
+    cached = _cached_delivery(delivery_id, updated_at)
+    if cached is not None:
+        return cached
+
+    row = session.execute(select(*_DELIVERY_ITEM_COLUMNS).where(DeliveryOutbox.id == delivery_id)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="delivery not found")
+    item = DeliveryOutboxSchema.model_validate(_delivery_item(row))
+    _cache_delivery(item)
+    return item
 
 
 @router.post("/{delivery_id}/override-url", response_model=DeliveryOutboxSchema)
@@ -75,28 +186,19 @@ def set_override_url(
     payload: OverrideURLRequest,
     session: Session = Depends(get_db_session),
 ):
-    row = _get_delivery(session, delivery_id)
-    row.override_target_url = payload.override_target_url
-    session.commit()
-    session.refresh(row)
-    return DeliveryOutboxSchema.model_validate(row)
+    return _update_delivery(session, delivery_id, override_target_url=payload.override_target_url)
 
 
 @router.post("/{delivery_id}/send-now", response_model=SendNowResponse)
 def send_now(delivery_id: UUID, session: Session = Depends(get_db_session)):
-    _get_delivery(session, delivery_id)
+    _ensure_delivery_exists(session, delivery_id)
     async_result = send_delivery.delay(str(delivery_id))
     return SendNowResponse(ok=True, task_id=async_result.id)
 
 
 @router.post("/{delivery_id}/mark-ready", response_model=DeliveryOutboxSchema)
 def mark_ready(delivery_id: UUID, session: Session = Depends(get_db_session)):
-    row = _get_delivery(session, delivery_id)
-    row.status = "READY_TO_SEND"
-    row.last_error = None
-    session.commit()
-    session.refresh(row)
-    return DeliveryOutboxSchema.model_validate(row)
+    return _update_delivery(session, delivery_id, status="READY_TO_SEND", last_error=None)
 
 
 @router.post("/{delivery_id}/schedule", response_model=DeliveryOutboxSchema)
@@ -105,9 +207,9 @@ def schedule_delivery(
     payload: ScheduleRequest,
     session: Session = Depends(get_db_session),
 ):
-    row = _get_delivery(session, delivery_id)
-    row.scheduled_for = payload.scheduled_for
-    row.updated_at = datetime.now(timezone.utc)
-    session.commit()
-    session.refresh(row)
-    return DeliveryOutboxSchema.model_validate(row)
+    return _update_delivery(
+        session,
+        delivery_id,
+        scheduled_for=payload.scheduled_for,
+        updated_at=datetime.now(timezone.utc),
+    )
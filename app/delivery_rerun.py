@@ -12,7 +12,7 @@ from pydantic import ValidationError
 from .delivery_schemas import RerunRequest
 from .job_input_store import get_job_input_payload, upsert_job_input
 from .s3_upload import find_latest_client_form_payload_with_diagnostics
-from .storage import get_payload, register_job, set_payload, set_status
+from .storage import create_job, get_payload
 from .tasks import run_full_job
 
 
@@ -327,9 +327,7 @@ def queue_rerun_from_payload(
     )
 
     new_job_id = str(uuid.uuid4())
-    asyncio.run(register_job(new_job_id))
-    asyncio.run(set_status(new_job_id, "queued"))
-    asyncio.run(set_payload(new_job_id, rerun_payload))
+    asyncio.run(create_job(new_job_id, "queued", rerun_payload))
     upsert_job_input(job_id=new_job_id, input_payload=rerun_payload)
     run_full_job.delay(new_job_id, rerun_payload)
     return new_job_id
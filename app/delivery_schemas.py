@@ -32,9 +32,12 @@ class DeliveryOutboxSchema(BaseModel):
 
 class DeliveryListResponse(BaseModel):
     items: list[DeliveryOutboxSchema]
-    page: int
+    # null only for cursor (before=...) pages.
+    page: int | None = None
     page_size: int
-    total: int
+    next_cursor: str | None = None
+    # null only when the caller opts out with with_total=false.
+    total: int | None = None
     status_filter: str | None = None
 
 
@@ -7,10 +7,13 @@ from .storage import append_log
 LogLevel = Literal["I", "D", "W", "E", "*"]
 
 
+# Both cases map straight to the finished prefix; anything else logs as info.
+_LOG_PREFIXES = {code: f"[{code.upper()}] " for code in ("I", "D", "W", "E", "*", "i", "d", "w", "e")}
+_DEFAULT_LOG_PREFIX = _LOG_PREFIXES["I"]
+
+
 def format_log(level: LogLevel, message: str) -> str:
-    l = (level or "I").upper()
-    code = l if l in {"I", "D", "W", "E", "*"} else "I"
-    return f"[{code}] {message}"
+    return _LOG_PREFIXES.get(level, _DEFAULT_LOG_PREFIX) + message
 
 
 async def log_line(job_id: str, level: LogLevel, message: str) -> None:
@@ -1,27 +1,42 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from .models import WebhookInput
 from .tasks import run_full_job
-from .storage import get_result, get_status, register_job, set_status, set_payload
+from .storage import create_job, get_result, get_status
 from .job_input_store import upsert_job_input
 from .ui import router as ui_router
 from .deliveries import router as deliveries_router
 from .admin import router as admin_router
-from .webhook_utils import collect_unknown_fields, normalize_webhook_payload
+from .templating import warm_templates
+from .webhook_utils import collect_unknown_fields
 
 load_dotenv()
 
 API_BEARER_TOKEN = os.getenv("API_BEARER_TOKEN", "").strip()
+_API_BEARER_TOKEN_DIGEST = hashlib.sha256(API_BEARER_TOKEN.encode("utf-8")).digest()
+_BEARER_PREFIX = "Bearer "
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_templates()
+    yield
+
+
+# Routes returning dicts/models are rendered with orjson instead of json.dumps.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 app.include_router(ui_router)
 app.include_router(deliveries_router)
 app.include_router(admin_router)
@@ -35,12 +50,12 @@ async def require_bearer(authorization: str | None = Header(default=None)) -> No
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing bearer token")
 
-    prefix = "Bearer "
-    if not authorization.startswith(prefix):
+    if not authorization.startswith(_BEARER_PREFIX):
         raise HTTPException(status_code=401, detail="Invalid authorization header")
 
-    token = authorization[len(prefix) :].strip()
-    if token != API_BEARER_TOKEN:
+    # Compare fixed-length digests in constant time, so neither content nor token length leaks.
+    token = authorization[len(_BEARER_PREFIX) :].strip().encode("utf-8")
+    if not hmac.compare_digest(hashlib.sha256(token).digest(), _API_BEARER_TOKEN_DIGEST):
         raise HTTPException(status_code=403, detail="Invalid bearer token")
 
 
@@ -49,26 +64,28 @@ async def healthz():
     return {"ok": True}
 
 
-@app.post("/webhook/pro-form", dependencies=[Depends(require_bearer)])
-async def webhook_pro_form(payload: WebhookInput, request: Request):
-    job_id = str(uuid.uuid4())
-    raw_body = None
-    try:
-        raw_body = await request.json()
-    except Exception:
-        raw_body = None
-    if isinstance(raw_body, dict):
-        normalized = normalize_webhook_payload(raw_body)
-        top_keys = sorted(normalized.keys())
+def _log_webhook_keys(job_id: str, normalized: dict, *, log_keys: bool, log_unknown: bool) -> None:
+    if log_keys and normalized:
+        logger.info("webhook_pro_form keys job_id=%s keys=%s", job_id, sorted(normalized.keys()))
+    if log_unknown:
         unknown_keys = sorted(set(collect_unknown_fields(normalized, WebhookInput)))
-        if top_keys:
-            logger.info("webhook_pro_form keys job_id=%s keys=%s", job_id, top_keys)
         if unknown_keys:
             logger.warning("webhook_pro_form unknown_keys job_id=%s keys=%s", job_id, unknown_keys)
-    await register_job(job_id)
-    await set_status(job_id, "queued")
+
+
+@app.post("/webhook/pro-form", dependencies=[Depends(require_bearer)])
+async def webhook_pro_form(payload: WebhookInput, background: BackgroundTasks):
+    # FastAPI parses the body once; WebhookInput keeps the normalized dict for the key log.
+    normalized = payload._normalized_input
+    job_id = str(uuid.uuid4())
+    # The key dump (INFO) and the unknown-key scan (WARNING) only feed logs: each runs only
+    # when its own level is enabled, and after the response.
+    log_keys = logger.isEnabledFor(logging.INFO)
+    log_unknown = logger.isEnabledFor(logging.WARNING)
+    if normalized is not None and (log_keys or log_unknown):
+        background.add_task(_log_webhook_keys, job_id, normalized, log_keys=log_keys, log_unknown=log_unknown)
     payload_dict = payload.model_dump(by_alias=False, mode="json")
-    await set_payload(job_id, payload_dict)
+    await create_job(job_id, "queued", payload_dict)
     try:
         await asyncio.to_thread(upsert_job_input, job_id=job_id, input_payload=payload_dict)
     except Exception as exc:
@@ -1,20 +1,27 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Literal, Union
+import sys
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Literal, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator, AliasChoices
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator, model_validator
 
 from .webhook_utils import normalize_webhook_payload
 
 
+@lru_cache(maxsize=None)
 def _to_camel(string: str) -> str:
+    # Field names repeat across the webhook models; build (and intern) each alias once.
     parts = string.split("_")
-    return parts[0] + "".join(word.capitalize() for word in parts[1:])
+    return sys.intern(parts[0] + "".join(word.capitalize() for word in parts[1:]))
 
 
 class WebhookBaseModel(BaseModel):
+    # WebhookInput snake_cases every key before validation, so fields are matched by name
+    # only; the camelCase aliases are kept for by_alias dumps but never probed on input.
     model_config = ConfigDict(
         extra="ignore",
-        populate_by_name=True,
+        validate_by_name=True,
+        validate_by_alias=False,
         alias_generator=_to_camel,
     )
 
@@ -22,60 +29,63 @@ class WebhookBaseModel(BaseModel):
 # -------------------------
 # Core content sub-models
 # -------------------------
+# Assistant/compile models are only exercised in the Celery worker; defer_build skips
+# building their validators at import in the web process. Pydantic copies model_config
+# per class, so the shared instances are safe to reuse.
+_FORBID = ConfigDict(extra="forbid", defer_build=True)
+_ALLOW = ConfigDict(extra="allow", defer_build=True)
+
+
 class Hero(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     title: str = ""
     content: str = ""
 
 
 class HeadingItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     heading: str = ""
     content: str = ""
 
 
 class FAQItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     question: str = ""
     answer: str = ""
 
 
-class StakesHome(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+class HeadingSection(BaseModel):
+    # title/subtitle shared by the stakes/values sections. Each subclass adds its own
+    # list field because the wire key differs per page kind (home_stakes_content, ...).
+    model_config = _FORBID
     title: str = ""
     subtitle: str = ""
+
+
+class StakesHome(HeadingSection):
     home_stakes_content: List[HeadingItem] = Field(default_factory=list)
 
 
-class ValuesHome(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    title: str = ""
-    subtitle: str = ""
+class ValuesHome(HeadingSection):
     home_values_content: List[HeadingItem] = Field(default_factory=list)
 
 
-class StakesAbout(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    title: str = ""
-    subtitle: str = ""
+class StakesAbout(HeadingSection):
     about_stakes_content: List[HeadingItem] = Field(default_factory=list)
 
 
-class ValuesAbout(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    title: str = ""
-    subtitle: str = ""
+class ValuesAbout(HeadingSection):
     about_values_content: List[HeadingItem] = Field(default_factory=list)
 
 
 class Guide(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     title: str = ""
     content: str = ""
 
 
 class CTA(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     title: str = ""
     content: str = ""
 
@@ -86,7 +96,7 @@ class CTA(BaseModel):
 # 1. Define this FIRST so it exists when SitemapMeta tries to use it.
 #    (I renamed 'Counts' to 'SitemapMetaCounts' to match your reference below)
 class SitemapMetaCounts(BaseModel):
-    model_config = ConfigDict(extra="allow")  # Changed to 'allow' to prevent validation errors on extra keys
+    model_config = _ALLOW  # Changed to 'allow' to prevent validation errors on extra keys
     mandatory: int = 0
     optional: int = 0
     service_details: int = 0
@@ -97,7 +107,7 @@ class SitemapMetaCounts(BaseModel):
 
 # 2. Define SitemapMeta SECOND.
 class SitemapMeta(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     business_name_sanitized: str = ""
     service_type: str = ""
     locale: str = "en-US"
@@ -108,7 +118,7 @@ class SitemapMeta(BaseModel):
 
 # 3. Rest of the models follow...
 class SitemapRow(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     path: str
     page_type: str
     page_title: str
@@ -126,21 +136,21 @@ class SitemapRow(BaseModel):
     navigation_label: Optional[str] = None
 
 class SitemapData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     version: str
     meta: SitemapMeta
     headers: List[Any]
     rows: List[SitemapRow]
 
 class SitemapAssistantOutput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     sitemap_data: SitemapData
 
 # -------------------------
 # Home/About payloads
 # -------------------------
 class HomePayload(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     path: str = ""
     page_title: Optional[str] = None
     html_title: str = ""
@@ -153,7 +163,7 @@ class HomePayload(BaseModel):
 
 
 class AboutPayload(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     path: str = ""
     page_title: Optional[str] = None
     html_title: str = ""
@@ -169,28 +179,22 @@ class AboutPayload(BaseModel):
 # -------------------------
 # SEO payload
 # -------------------------
-class SEOStakes(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    title: str = ""
-    subtitle: str = ""
+class SEOStakes(HeadingSection):
     seo_stakes_content: List[HeadingItem] = Field(default_factory=list)
 
 
-class SEOValues(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    title: str = ""
-    subtitle: str = ""
+class SEOValues(HeadingSection):
     seo_values_content: List[HeadingItem] = Field(default_factory=list)
 
 
 class SEOFAQ(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     title: str = ""
     content: List[FAQItem] = Field(default_factory=list)
 
 
 class SEOFields(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     html_title: str = ""
     meta_description: str = ""
     seo_hero: Hero = Field(default_factory=Hero)
@@ -200,8 +204,18 @@ class SEOFields(BaseModel):
     seo_cta: CTA = Field(default_factory=CTA)
 
 
+_SEO_PAGE_TYPES = {
+    "service": "service",
+    "seo-service": "service",
+    "industry": "industry",
+    "seo-industry": "industry",
+    "location": "location",
+    "seo-location": "location",
+}
+
+
 class SEOPageItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     path: str = ""
     page_title: Optional[str] = None
     seo_page_type: str = "service"
@@ -213,37 +227,31 @@ class SEOPageItem(BaseModel):
     @field_validator("seo_page_type", mode="before")
     @classmethod
     def _normalize_seo_page_type(cls, v):
-        t = str(v or "").strip().lower()
-        mapping = {
-            "service": "service",
-            "seo-service": "service",
-            "industry": "industry",
-            "seo-industry": "industry",
-            "location": "location",
-            "seo-location": "location",
-        }
-        return mapping.get(t, "service")
+        # Already-canonical strings (the common case) map to themselves without cleanup.
+        if type(v) is str and v in _SEO_PAGE_TYPES:
+            return _SEO_PAGE_TYPES[v]
+        return _SEO_PAGE_TYPES.get(str(v or "").strip().lower(), "service")
 
 
 # -------------------------
 # Envelopes returned by assistant
 # -------------------------
 class HomeEnvelope(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     page_kind: Literal["home"]
     path: str
     home: HomePayload
 
 
 class AboutEnvelope(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     page_kind: Literal["about"]
     path: str
     about: AboutPayload
 
 
 class SEOEnvelope(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     page_kind: Literal["seo_page"]
     path: str
     seo_page: SEOPageItem
@@ -251,46 +259,47 @@ class SEOEnvelope(BaseModel):
 
 class UtilityAboutItem(AboutPayload):
     # Same as AboutPayload plus identifiers
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     content_page_type: Literal["about-why", "about-team"]
 
 
 class UtilityEnvelope(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     page_kind: Literal["utility_page"]
     path: str
     utility_page: UtilityAboutItem
 
 
 class SkipEnvelope(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     page_kind: Literal["skip"]
     path: str
     reason: str = "non-generative"
 
 
-AssistantEnvelope = Union[HomeEnvelope, AboutEnvelope, SEOEnvelope, UtilityEnvelope, SkipEnvelope]
+# Tagged on page_kind: validation goes straight to the matching envelope instead of trying each in turn.
+AssistantEnvelope = Annotated[
+    Union[HomeEnvelope, AboutEnvelope, SEOEnvelope, UtilityEnvelope, SkipEnvelope],
+    Field(discriminator="page_kind"),
+]
 
 
 # -------------------------
 # Final compiled output schema
 # -------------------------
 class UtilityAboutContent(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     title: str = ""
     subtitle: str = ""
     content: str = ""
 
 
-class UtilityAboutValues(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-    title: str = ""
-    subtitle: str = ""
-    about_values_content: List[HeadingItem] = Field(default_factory=list)
+# Same shape as the about page's values section; share the model (and its schema).
+UtilityAboutValues = ValuesAbout
 
 
 class UtilityPageOutput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     page_id: None = None
     page_title: str = ""
     slug: str = ""
@@ -306,6 +315,7 @@ class CampaignPageContent(BaseModel):
         extra="forbid",
         populate_by_name=True,
         serialize_by_alias=True,
+        defer_build=True,
     )
     slug: str = ""
     title: str = ""
@@ -315,17 +325,17 @@ class CampaignPageContent(BaseModel):
 
 
 class CampaignPageData(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     content: CampaignPageContent
 
 
 class CampaignPageItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     data: CampaignPageData
 
 
 class FinalCopyOutput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = _FORBID
     home: HomePayload = Field(default_factory=HomePayload)
     about: AboutPayload = Field(default_factory=AboutPayload)
     seo_pages: List[SEOPageItem] = Field(default_factory=list)
@@ -338,15 +348,8 @@ class FinalCopyOutput(BaseModel):
 # -------------------------
 class MetadataInput(WebhookBaseModel):
     business_name: str = ""
-    business_domain: str = Field(
-        default="",
-        validation_alias=AliasChoices(
-            "business_domain",
-            "businessDomain",
-            "domain_name",
-            "domainName",
-        ),
-    )
+    # domainName / domain_name are folded into business_domain by normalize_webhook_payload.
+    business_domain: str = ""
     submission_datetime: Optional[datetime] = None
     service_type: str = ""
 
@@ -449,24 +452,41 @@ class UserDataInput(WebhookBaseModel):
 
 class WebhookInput(WebhookBaseModel):
     metadata: MetadataInput = Field(default_factory=MetadataInput)
-    user_data: UserDataInput = Field(
-        default_factory=UserDataInput,
-        validation_alias=AliasChoices("user_data", "userData", "userdata"),
-    )
-    query_string: Dict[str, Any] = Field(
-        default_factory=dict,
-        validation_alias=AliasChoices("query_string", "queryString", "querystring"),
-    )
-    job_details: Dict[str, Any] = Field(
-        default_factory=dict,
-        validation_alias=AliasChoices("job_details", "jobDetails", "jobdetails"),
-    )
+    user_data: UserDataInput = Field(default_factory=UserDataInput)
+    query_string: Dict[str, Any] = Field(default_factory=dict)
+    job_details: Dict[str, Any] = Field(default_factory=dict)
     sitemap_data: Optional[Dict[str, Any]] = None
 
-    @model_validator(mode="before")
+    # The snake-cased input this instance was validated from; the webhook route's key log
+    # reuses it instead of normalizing the body a second time.
+    _normalized_input: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
     @classmethod
-    def _normalize_payload_keys(cls, data):
-        return normalize_webhook_payload(data)
+    def _normalize_payload_keys(cls, data, handler):
+        normalized = normalize_webhook_payload(data)
+        model = handler(normalized)
+        if isinstance(normalized, dict):
+            model._normalized_input = normalized
+        return model
 
 
 WebhookInput.model_rebuild()
+
+
+# The deferred assistant/compile models the worker validates on every job; built up front
+# at worker start (see build_worker_models) so the first job doesn't pay for the schemas.
+_WORKER_MODELS = (
+    FinalCopyOutput,
+    HomeEnvelope,
+    AboutEnvelope,
+    SEOEnvelope,
+    UtilityEnvelope,
+    SkipEnvelope,
+    CampaignPageItem,
+)
+
+
+def build_worker_models() -> None:
+    for model in _WORKER_MODELS:
+        model.model_rebuild()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
 from datetime import datetime
 from typing import Dict, Any, List
 
+import orjson
+
 from .storage import get_monthly_queue_logs, clear_monthly_queue_logs
 from .s3_upload import upload_monthly_logs
 
 
+def _encode_logs(payload: Dict[str, Any]) -> bytes:
+    return gzip.compress(orjson.dumps(payload))
+
+
 def parse_month(month_yyyy_mm: str) -> tuple[str, int]:
     dt = datetime.strptime(month_yyyy_mm + "-01", "%Y-%m-%d")
     return dt.strftime("%B"), dt.year
@@ -17,7 +25,9 @@ async def upload_monthly_queue_logs(month_yyyy_mm: str) -> Dict[str, Any]:
     month_name, year = parse_month(month_yyyy_mm)
 
     payload = {"month": month_yyyy_mm, "jobs": items}
-    s3_key = upload_monthly_logs(month_name=month_name, year=year, logs=payload)
+    # A month of job logs can be large; keep the encode + compress off the event loop.
+    body = await asyncio.to_thread(_encode_logs, payload)
+    s3_key = upload_monthly_logs(month_name=month_name, year=year, gzipped_body=body)
 
     await clear_monthly_queue_logs(month_yyyy_mm)
 
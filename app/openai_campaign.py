@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 from typing import Any, Dict, List, Optional
 
-from openai import OpenAI, AssistantEventHandler
+import orjson
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AssistantEventHandler,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from pydantic import TypeAdapter, ValidationError
 from typing_extensions import override
 
@@ -19,9 +26,16 @@ if not OPENAI_API_KEY:
 
 CampaignItemAdapter = TypeAdapter(CampaignPageItem)
 
+# Process-wide: campaign pages share one connection pool (httpx.Client is thread-safe).
+client = OpenAI(
+    api_key=OPENAI_API_KEY,
+    default_headers={"OpenAI-Beta": "assistants=v2"},
+)
+
 MAX_CAMPAIGN_RETRIES = int(os.getenv("MAX_CAMPAIGN_RETRIES", os.getenv("MAX_PAGE_RETRIES", "3")))
 OPENAI_TRANSIENT_RETRIES = int(os.getenv("OPENAI_TRANSIENT_RETRIES", "4"))
 OPENAI_BASE_BACKOFF = float(os.getenv("OPENAI_BASE_BACKOFF", "0.8"))
+_TRANSIENT_OPENAI_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
 
 
 class CampaignGenerationError(RuntimeError):
@@ -51,14 +65,7 @@ class JSONCollector(AssistantEventHandler):
 
 
 def _minify_payload(payload: Dict[str, Any]) -> str:
-    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-
-
-def _new_client() -> OpenAI:
-    return OpenAI(
-        api_key=OPENAI_API_KEY,
-        default_headers={"OpenAI-Beta": "assistants=v2"},
-    )
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def _derive_slug_from_path(path: str) -> str:
@@ -254,8 +261,6 @@ def run_campaign_streaming_blocking(
             log_lines.append(line)
         print(line)
 
-    client = _new_client()
-
     thread = client.beta.threads.create()
     _log(f"[campaign] thread_id: {thread.id}")
 
@@ -289,8 +294,8 @@ def run_campaign_streaming_blocking(
 
     raw = handler.text()
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
         raise CampaignParseError(
             "campaign response was not valid JSON",
             details={"error": str(exc), "raw": raw[:2000]},
@@ -305,21 +310,11 @@ def run_campaign_streaming_blocking(
             details={"error": str(exc), "coerced": coerced, "raw": raw[:2000]},
         ) from exc
 
-    return json.loads(validated.model_dump_json(by_alias=True))
+    return validated.model_dump(mode="json", by_alias=True)
 
 
 def _is_transient_openai_error(e: Exception) -> bool:
-    name = e.__class__.__name__
-    msg = str(e).lower()
-    if "rate limit" in msg or "429" in msg:
-        return True
-    if "timeout" in msg or "timed out" in msg:
-        return True
-    if "502" in msg or "503" in msg or "504" in msg:
-        return True
-    if name in {"APITimeoutError", "RateLimitError", "APIConnectionError", "InternalServerError"}:
-        return True
-    return False
+    return isinstance(e, _TRANSIENT_OPENAI_ERRORS)
 
 
 async def _call_openai_with_transient_retries(
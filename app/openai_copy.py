@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
+import random
 from typing import Any, Dict, Optional, List
 
-from openai import OpenAI, AssistantEventHandler
+import orjson
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncAssistantEventHandler,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
 from pydantic import TypeAdapter, ValidationError
 from typing_extensions import override
 
@@ -21,36 +29,46 @@ if not PRO_COPY_ASSISTANT_ID:
 
 EnvelopeAdapter = TypeAdapter(AssistantEnvelope)
 
+
+def new_copy_client() -> AsyncOpenAI:
+    # Owned by the caller, which closes it (async with) before its event loop ends; the
+    # pages of one job share it, and with it one connection pool.
+    return AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        default_headers={"OpenAI-Beta": "assistants=v2"},
+    )
+
+
 MAX_PAGE_RETRIES = int(os.getenv("MAX_PAGE_RETRIES", "3"))
 OPENAI_TRANSIENT_RETRIES = int(os.getenv("OPENAI_TRANSIENT_RETRIES", "4"))
 OPENAI_BASE_BACKOFF = float(os.getenv("OPENAI_BASE_BACKOFF", "0.8"))
+OPENAI_MAX_BACKOFF = float(os.getenv("OPENAI_MAX_BACKOFF", "30"))
+# Capped exponential schedules, jittered at sleep time so the pages of one
+# job (asyncio.gather in workflow) don't retry in lockstep against the same rate limit.
+_BACKOFFS = [min(OPENAI_MAX_BACKOFF, OPENAI_BASE_BACKOFF * (2**i)) for i in range(OPENAI_TRANSIENT_RETRIES)]
+_PAGE_BACKOFFS = [min(OPENAI_MAX_BACKOFF, 0.6 * (2**i)) for i in range(MAX_PAGE_RETRIES)]
+# The SDK maps 429 to RateLimitError, 5xx to InternalServerError, and wraps network
+# failures and timeouts (APITimeoutError subclasses APIConnectionError).
+_TRANSIENT_OPENAI_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
 
 
-class JSONCollector(AssistantEventHandler):
+class JSONCollector(AsyncAssistantEventHandler):
     def __init__(self) -> None:
         super().__init__()
-        self._buf: list[str] = []
+        self._buf = bytearray()
 
     @override
-    def on_text_delta(self, delta, snapshot):
-        try:
-            self._buf.append(delta.value)
-        except Exception:
-            pass
+    async def on_text_delta(self, delta, snapshot):
+        if value := delta.value:
+            self._buf += value.encode("utf-8", "surrogatepass")
 
-    def text(self) -> str:
-        return "".join(self._buf).strip()
+    def raw(self) -> bytearray:
+        # UTF-8 bytes as streamed; orjson skips surrounding whitespace, so no strip/join copy.
+        return self._buf
 
 
 def _minify_payload(payload: Dict[str, Any]) -> str:
-    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-
-
-def _new_client() -> OpenAI:
-    return OpenAI(
-        api_key=OPENAI_API_KEY,
-        default_headers={"OpenAI-Beta": "assistants=v2"},
-    )
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def _payload_path(payload: Dict[str, Any]) -> str:
@@ -180,8 +198,10 @@ def _coerce_envelope(data: Any, payload: Dict[str, Any]) -> Any:
     return data
 
 
-def run_copy_streaming_blocking(
+async def run_copy_streaming(
+    client: AsyncOpenAI,
     payload: Dict[str, Any],
+    payload_json: str,
     log_lines: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     def _log(line: str) -> None:
@@ -189,29 +209,27 @@ def run_copy_streaming_blocking(
             log_lines.append(line)
         print(line)
 
-    client = _new_client()
-
-    thread = client.beta.threads.create()
+    thread = await client.beta.threads.create()
     _log(f"[copy] thread_id: {thread.id}")
 
-    client.beta.threads.messages.create(
+    await client.beta.threads.messages.create(
         thread_id=thread.id,
         role="user",
-        content=_minify_payload(payload),
+        content=payload_json,
     )
 
     handler = JSONCollector()
-    with client.beta.threads.runs.stream(
+    async with client.beta.threads.runs.stream(
         thread_id=thread.id,
         assistant_id=PRO_COPY_ASSISTANT_ID,
         event_handler=handler,
     ) as stream:
-        stream.until_done()
+        await stream.until_done()
         run = None
         get_final_run = getattr(stream, "get_final_run", None)
         if callable(get_final_run):
             try:
-                run = get_final_run()
+                run = await get_final_run()
             except Exception:
                 run = None
         run_id = getattr(run, "id", "") if run is not None else ""
@@ -222,53 +240,83 @@ def run_copy_streaming_blocking(
             _log(f"[copy] thread_url: {thread_url}")
             _log(f"[copy] run_url: {run_url}")
 
-    raw = handler.text()
-    data = json.loads(raw)
-    coerced = _coerce_envelope(data, payload)
-    validated = EnvelopeAdapter.validate_python(coerced)
-    return json.loads(validated.model_dump_json())
+    raw = handler.raw()
+    try:
+        # Well-formed envelopes are parsed and validated in one pydantic-core pass.
+        validated = EnvelopeAdapter.validate_json(raw)
+    except ValidationError:
+        # Legacy/wrapped shapes go through _coerce_envelope, which needs the decoded dict.
+        data = orjson.loads(raw)
+        coerced = _coerce_envelope(data, payload)
+        validated = EnvelopeAdapter.validate_python(coerced)
+    else:
+        if not validated.path:
+            validated.path = _payload_path(payload)
+    return EnvelopeAdapter.dump_python(validated, mode="json")
+
+
+def _jittered(delay: float) -> float:
+    return delay * (0.5 + random.random())
+
+
+def _retry_after_seconds(e: Exception) -> Optional[float]:
+    # 429s carry the server's own wait hint; HTTP-date Retry-After values are ignored.
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000.0
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+    except ValueError:
+        return None
+    return None
+
+
+def _transient_retry_delay(e: Exception, attempt: int) -> float:
+    retry_after = _retry_after_seconds(e)
+    if retry_after is not None:
+        return min(OPENAI_MAX_BACKOFF, max(0.0, retry_after))
+    return _jittered(_BACKOFFS[attempt - 1])
 
 
 def _is_transient_openai_error(e: Exception) -> bool:
-    name = e.__class__.__name__
-    msg = str(e).lower()
-    if "rate limit" in msg or "429" in msg:
-        return True
-    if "timeout" in msg or "timed out" in msg:
-        return True
-    if "502" in msg or "503" in msg or "504" in msg:
-        return True
-    if name in {"APITimeoutError", "RateLimitError", "APIConnectionError", "InternalServerError"}:
-        return True
-    return False
+    return isinstance(e, _TRANSIENT_OPENAI_ERRORS)
 
 
 async def _call_openai_with_transient_retries(
+    client: AsyncOpenAI,
     payload: Dict[str, Any],
+    payload_json: str,
     log_lines: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     last_err: Optional[str] = None
     for attempt in range(1, OPENAI_TRANSIENT_RETRIES + 1):
         try:
-            return await asyncio.to_thread(run_copy_streaming_blocking, payload, log_lines)
+            return await run_copy_streaming(client, payload, payload_json, log_lines)
         except Exception as e:
             if _is_transient_openai_error(e) and attempt < OPENAI_TRANSIENT_RETRIES:
                 last_err = str(e)
-                await asyncio.sleep(OPENAI_BASE_BACKOFF * attempt)
+                await asyncio.sleep(_transient_retry_delay(e, attempt))
                 continue
             raise
     raise RuntimeError(last_err or "unknown error")
 
 
-async def generate_page_with_retries(payload, log_lines: Optional[List[str]] = None):
+async def generate_page_with_retries(client: AsyncOpenAI, payload, log_lines: Optional[List[str]] = None):
     last_err = None
+    # Every attempt sends the same message; serialize it once for all of them.
+    payload_json = _minify_payload(payload)
     for attempt in range(1, MAX_PAGE_RETRIES + 1):
         try:
-            return await _call_openai_with_transient_retries(payload, log_lines=log_lines)
-        except (json.JSONDecodeError, ValidationError) as e:
+            return await _call_openai_with_transient_retries(client, payload, payload_json, log_lines=log_lines)
+        except (orjson.JSONDecodeError, ValidationError) as e:
             last_err = f"parse/validation error: {e}"
         except Exception as e:
             last_err = f"run error: {e}"
-        await asyncio.sleep(0.6 * attempt)
+        await asyncio.sleep(_jittered(_PAGE_BACKOFFS[attempt - 1]))
 
     raise RuntimeError(f"page generation failed after {MAX_PAGE_RETRIES}: {last_err}")
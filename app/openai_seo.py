@@ -4,16 +4,30 @@ import asyncio
 import json
 import os
 import re
-import time
 from typing import Any, Dict, List, Optional
 
 import httpx
-from openai import OpenAI
+from openai import APITimeoutError, AsyncAssistantEventHandler, AsyncOpenAI
+from typing_extensions import override
 
 
 OPENAI_API_KEY = (os.getenv("OPENAI_API_KEY") or "").strip()
 ASSISTANT_ID = (os.getenv("OPENAI_SEO_ASSISTANT_ID") or os.getenv("OPENAI_SEO_ASSISTANT_ID", "asst_xVVUucXLTmM2QxP2GDw5RrMR")).strip()
 RENDER_ENDPOINT = (os.getenv("SEO_SERVICE_RENDER_ENDPOINT") or "https://api-endpoints-ougl.onrender.com/analyze").strip()
+ASSISTANT_RUN_TIMEOUT = 180.0
+
+_TERMINAL_RUN_EVENTS = {
+    "thread.run.completed",
+    "thread.run.failed",
+    "thread.run.expired",
+    "thread.run.cancelled",
+    "thread.run.incomplete",
+}
+
+_BULLET_RE = re.compile(r"^(\d+[\).\s]+|-|\*|\u2022)\s*(.+)$")
+_TRAIL_DASH_RE = re.compile(r"\s+\-\s+.*$")
+_KEYWORDS_LINE_RE = re.compile(r"(?i)\bkeywords?\b\s*:\s*(.+)$", re.MULTILINE)
+_SPLIT_RE = re.compile(r"[,\n]")
 
 
 def _extract_domain(metadata: Dict[str, Any]) -> str:
@@ -73,19 +87,19 @@ def _parse_keywords(text: str) -> List[str]:
         s = line.strip()
         if not s:
             continue
-        m = re.match(r"^(\d+[\).\s]+|-|\*|\u2022)\s*(.+)$", s)
+        m = _BULLET_RE.match(s)
         if m:
             item = m.group(2).strip()
-            item = re.sub(r"\s+\-\s+.*$", "", item).strip()
+            item = _TRAIL_DASH_RE.sub("", item).strip()
             item = item.strip('"').strip("'").strip()
             if item:
                 candidates.append(item)
 
     if not candidates:
-        m = re.search(r"(?i)\bkeywords?\b\s*:\s*(.+)$", text, flags=re.MULTILINE)
+        m = _KEYWORDS_LINE_RE.search(text)
         if m:
             tail = m.group(1)
-            parts = [p.strip() for p in re.split(r"[,\n]", tail) if p.strip()]
+            parts = [p.strip() for p in _SPLIT_RE.split(tail) if p.strip()]
             candidates.extend(parts)
 
     out2: List[str] = []
@@ -104,72 +118,90 @@ def _parse_keywords(text: str) -> List[str]:
     return out2
 
 
-def _run_assistant_sync(*, assistant_id: str, user_json_input: Dict[str, Any], domain_url: str) -> Dict[str, Any]:
+class _SEORunHandler(AsyncAssistantEventHandler):
+    """Collects the assistant's reply and answers analyze_client_website tool calls."""
+
+    def __init__(self, client: AsyncOpenAI, domain_url: str, result: Dict[str, Any]) -> None:
+        super().__init__()
+        self._client = client
+        self._domain_url = domain_url
+        # Shared with the handler of the tool-output stream, which carries the rest of the run.
+        self._result = result
+
+    @override
+    async def on_message_done(self, message) -> None:
+        try:
+            self._result["raw"] = message.content[0].text.value
+        except Exception:
+            pass
+
+    @override
+    async def on_event(self, event) -> None:
+        if event.event == "thread.run.requires_action":
+            await self._submit_tool_outputs(event.data)
+        elif event.event in _TERMINAL_RUN_EVENTS:
+            self._result["status"] = event.data.status
+
+    async def _submit_tool_outputs(self, run) -> None:
+        tool_outputs = []
+        for tool in run.required_action.submit_tool_outputs.tool_calls:
+            if tool.function.name == "analyze_client_website":
+                try:
+                    args = json.loads(tool.function.arguments or "{}")
+                except Exception:
+                    args = {}
+                domain = (args.get("domain_url") or self._domain_url or "").strip()
+                output_data = await _fetch_website_seo_data(domain)
+                tool_outputs.append({"tool_call_id": tool.id, "output": output_data})
+
+        if tool_outputs:
+            async with self._client.beta.threads.runs.submit_tool_outputs_stream(
+                thread_id=run.thread_id,
+                run_id=run.id,
+                tool_outputs=tool_outputs,
+                event_handler=_SEORunHandler(self._client, self._domain_url, self._result),
+            ) as stream:
+                await stream.until_done()
+
+
+async def _run_assistant(*, assistant_id: str, user_json_input: Dict[str, Any], domain_url: str) -> Dict[str, Any]:
     if not OPENAI_API_KEY:
         return {"ok": False, "error": "missing_openai_api_key", "keywords": [], "raw": ""}
 
     if not assistant_id:
         return {"ok": False, "error": "missing_assistant_id", "keywords": [], "raw": ""}
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    thread = client.beta.threads.create()
-
-    client.beta.threads.messages.create(
-        thread_id=thread.id,
-        role="user",
-        content=json.dumps(user_json_input),
-    )
-
-    run = client.beta.threads.runs.create(
-        thread_id=thread.id,
-        assistant_id=assistant_id,
-    )
-
-    started = time.time()
-    raw = ""
-
-    while True:
-        if time.time() - started > 180:
-            return {"ok": False, "error": "timeout_waiting_for_assistant", "keywords": [], "raw": raw}
-
-        time.sleep(1.0)
-        run = client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
-
-        if run.status == "requires_action":
-            tool_calls = run.required_action.submit_tool_outputs.tool_calls
-            tool_outputs = []
+    result: Dict[str, Any] = {"status": "", "raw": ""}
+    # Scoped to the run: each job runs under its own event loop, so a pooled client would
+    # outlive the loop its connections belong to.
+    async with AsyncOpenAI(api_key=OPENAI_API_KEY) as client:
+        thread = await client.beta.threads.create()
+
+        await client.beta.threads.messages.create(
+            thread_id=thread.id,
+            role="user",
+            content=json.dumps(user_json_input),
+        )
+
+        try:
+            # Budget for the whole run, tool-output round included; an httpx timeout would only
+            # bound each read, so a run that keeps emitting events could outlive it.
+            async with asyncio.timeout(ASSISTANT_RUN_TIMEOUT):
+                async with client.beta.threads.runs.stream(
+                    thread_id=thread.id,
+                    assistant_id=assistant_id,
+                    event_handler=_SEORunHandler(client, domain_url, result),
+                ) as stream:
+                    await stream.until_done()
+        except (TimeoutError, APITimeoutError):
+            return {"ok": False, "error": "timeout_waiting_for_assistant", "keywords": [], "raw": result["raw"]}
 
-            for tool in tool_calls:
-                if tool.function.name == "analyze_client_website":
-                    try:
-                        args = json.loads(tool.function.arguments or "{}")
-                    except Exception:
-                        args = {}
-                    domain = (args.get("domain_url") or domain_url or "").strip()
-                    output_data = asyncio.run(_fetch_website_seo_data(domain))
-                    tool_outputs.append({"tool_call_id": tool.id, "output": output_data})
+    raw = result["raw"]
+    if result["status"] != "completed":
+        return {"ok": False, "error": f"assistant_run_{result['status'] or 'incomplete'}", "keywords": [], "raw": raw}
 
-            if tool_outputs:
-                client.beta.threads.runs.submit_tool_outputs(
-                    thread_id=thread.id,
-                    run_id=run.id,
-                    tool_outputs=tool_outputs,
-                )
-
-        elif run.status == "completed":
-            messages = client.beta.threads.messages.list(thread_id=thread.id)
-            for msg in messages.data:
-                if msg.role == "assistant":
-                    try:
-                        raw = msg.content[0].text.value
-                    except Exception:
-                        raw = ""
-                    break
-            keywords = _parse_keywords(raw)
-            return {"ok": True, "error": "", "keywords": keywords[:5], "raw": raw}
-
-        elif run.status in ("failed", "expired", "cancelled"):
-            return {"ok": False, "error": f"assistant_run_{run.status}", "keywords": [], "raw": raw}
+    keywords = _parse_keywords(raw)
+    return {"ok": True, "error": "", "keywords": keywords[:5], "raw": raw}
 
 
 async def generate_seo_keywords(*, metadata: Dict[str, Any], user_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -180,10 +212,8 @@ async def generate_seo_keywords(*, metadata: Dict[str, Any], user_data: Dict[str
         "domain_url": domain_url,
     }
 
-    out = await asyncio.to_thread(
-        _run_assistant_sync,
+    return await _run_assistant(
         assistant_id=ASSISTANT_ID,
         user_json_input=user_json_input,
         domain_url=domain_url,
     )
-    return out
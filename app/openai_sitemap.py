@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 from typing import Any, Dict, List, Optional
 
+import orjson
 from openai import OpenAI, AssistantEventHandler
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing_extensions import override
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
@@ -66,51 +66,37 @@ class SitemapAssistantOutput(BaseModel):
 class JSONCollector(AssistantEventHandler):
     def __init__(self) -> None:
         super().__init__()
-        self._buf: list[str] = []
+        self._buf = bytearray()
 
     @override
     def on_text_delta(self, delta, snapshot):
-        try:
-            self._buf.append(delta.value)
-        except Exception:
-            pass
+        if value := delta.value:
+            self._buf += value.encode("utf-8", "surrogatepass")
 
-    def text(self) -> str:
-        return "".join(self._buf).strip()
+    def raw(self) -> bytearray:
+        return self._buf
 
 
 def _minify(payload: Dict[str, Any]) -> str:
-    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def _normalize_sitemap_output(data: Any) -> Dict[str, Any]:
+    # Takes ownership of a freshly decoded response and fixes it up in place.
     if not isinstance(data, dict):
         return {"sitemap_data": {"version": "", "meta": {}, "headers": [], "rows": []}}
 
-    root = dict(data)
-    root.pop("name", None)
+    data.pop("name", None)
 
-    sitemap_data = root.get("sitemap_data")
+    sitemap_data = data.get("sitemap_data")
     if not isinstance(sitemap_data, dict):
-        sitemap_data = root if isinstance(root.get("rows"), list) else {}
-
-    sitemap_data = dict(sitemap_data)
+        sitemap_data = data if isinstance(data.get("rows"), list) else {}
 
     meta = sitemap_data.get("meta")
-    if not isinstance(meta, dict):
-        meta = {}
+    if isinstance(meta, dict):
+        meta.pop("fail_report", None)
     else:
-        meta = dict(meta)
-
-    meta.pop("fail_report", None)
-
-    rows = sitemap_data.get("rows")
-    if not isinstance(rows, list):
-        rows = []
-
-    counts_in = meta.get("counts")
-    if isinstance(counts_in, dict):
-        meta["counts"] = dict(counts_in)
+        meta = {}
 
     sitemap_data["meta"] = meta
     return {"sitemap_data": sitemap_data}
@@ -156,12 +142,17 @@ def run_sitemap_streaming_blocking(
             _log(f"[sitemap] thread_url: {thread_url}")
             _log(f"[sitemap] run_url: {run_url}")
 
-    raw = handler.text()
-    data = json.loads(raw)
-    data = _normalize_sitemap_output(data)
-
-    validated = SitemapAssistantOutput.model_validate(data)
-    return json.loads(validated.model_dump_json())
+    raw = handler.raw()
+    try:
+        # Output already in the final shape validates straight from the JSON text.
+        validated = SitemapAssistantOutput.model_validate_json(raw)
+    except ValidationError:
+        # Anything _normalize_sitemap_output would rewrite (a top-level name, meta.fail_report,
+        # rows at the root) is rejected by the forbid models and lands here.
+        data = orjson.loads(raw)
+        data = _normalize_sitemap_output(data)
+        validated = SitemapAssistantOutput.model_validate(data)
+    return validated.model_dump(mode="json")
 
 
 async def generate_sitemap_streaming(
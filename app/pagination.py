@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import func, tuple_
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+# Keyset cursors for the admin listings: "<iso timestamp>|<row uuid>" of the last row shown.
+CURSOR_SEPARATOR = "|"
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    return f"{sort_value.isoformat()}{CURSOR_SEPARATOR}{row_id}"
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+    if not cursor:
+        return None
+    ts_raw, sep, id_raw = cursor.strip().partition(CURSOR_SEPARATOR)
+    if not sep:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+    try:
+        return datetime.fromisoformat(ts_raw), UUID(id_raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+
+def split_page(rows: list, page_size: int, sort_attr: str) -> tuple[list, str | None]:
+    # Callers fetch page_size + 1 rows; the extra one only signals that another page exists.
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, _row_cursor(rows[-1], sort_attr)
+
+
+def _row_cursor(row, sort_attr: str) -> str:
+    return encode_cursor(getattr(row, sort_attr), row.id)
+
+
+def _extend(stmt, fn):
+    # Lambda statements grow with +=, so they keep their cached compiled form.
+    if isinstance(stmt, StatementLambdaElement):
+        return stmt + fn
+    return fn(stmt)
+
+
+def fetch_keyset_page(
+    session,
+    stmt,
+    *,
+    count_stmt,
+    keyset: tuple,
+    before: tuple[datetime, UUID] | None,
+    page_size: int,
+    with_total: bool,
+    after: tuple[datetime, UUID] | None = None,
+    scalars: bool = True,
+    offset: int = 0,
+) -> tuple[list, str | None, str | None, int | None]:
+    # stmt is the filtered, unordered select (plain or lambda_stmt); keyset is its
+    # (sort column, id column) pair, which supplies the ORDER BY and the cursor range.
+    # Returns (rows, next_cursor, prev_cursor, total): next_cursor is a before= value for
+    # older rows, prev_cursor an after= value for newer ones.
+    # scalars=False is for column selects: rows come back as Row tuples instead of entities.
+    # offset only serves legacy page-number requests; cursor pages leave it at 0.
+    sort_col, id_col = keyset
+    total = None
+    # after= walks back towards the newest rows: read ascending from the cursor, then flip.
+    backward = after is not None and before is None
+    window_total = before is None and after is None and not offset and with_total
+    if window_total:
+        # First page: count(*) OVER () is evaluated before LIMIT, so the total rides along.
+        stmt = _extend(stmt, lambda s: s.add_columns(func.count().over().label("total_count")))
+    elif with_total:
+        # Past the first page the keyset WHERE would skew a window count (and an OFFSET past
+        # the end returns no row to carry it); count separately.
+        total = int(session.execute(count_stmt).scalar_one() or 0)
+    if before is not None:
+        before_ts, before_id = before
+        stmt = _extend(stmt, lambda s: s.where(tuple_(sort_col, id_col) < tuple_(before_ts, before_id)))
+    elif backward:
+        after_ts, after_id = after
+        stmt = _extend(stmt, lambda s: s.where(tuple_(sort_col, id_col) > tuple_(after_ts, after_id)))
+    if backward:
+        stmt = _extend(stmt, lambda s: s.order_by(sort_col.asc(), id_col.asc()))
+    else:
+        stmt = _extend(stmt, lambda s: s.order_by(sort_col.desc(), id_col.desc()))
+    if offset:
+        stmt = _extend(stmt, lambda s: s.offset(offset))
+    limit = page_size + 1
+    stmt = _extend(stmt, lambda s: s.limit(limit))
+
+    if window_total:
+        result = session.execute(stmt).all()
+        total = int(result[0].total_count) if result else 0
+        rows = [row[0] for row in result] if scalars else result
+    elif scalars:
+        rows = list(session.scalars(stmt).all())
+    else:
+        rows = list(session.execute(stmt).all())
+
+    if backward:
+        # The extra row here means newer rows remain; the after= row itself is older.
+        has_newer = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        next_cursor = _row_cursor(rows[-1], sort_col.key) if rows else None
+        prev_cursor = _row_cursor(rows[0], sort_col.key) if rows and has_newer else None
+        return rows, next_cursor, prev_cursor, total
+
+    rows, next_cursor = split_page(rows, page_size, sort_col.key)
+    # Anything but the newest page has newer rows before it (the cursor row, at least).
+    has_newer = before is not None or bool(offset)
+    prev_cursor = _row_cursor(rows[0], sort_col.key) if rows and has_newer else None
+    return rows, next_cursor, prev_cursor, total
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from .copy_store import get_job_copy_data
 from .s3_upload import download_json, upload_delivered_copy
 
@@ -39,8 +40,9 @@ def payload_path_for_job(job_id: str) -> str:
 def save_payload_json(job_id: str, data: Any) -> str:
     path = payload_path_for_job(job_id)
     tmp = f"{path}.tmp"
-    body = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
-    with open(tmp, "w", encoding="utf-8") as f:
+    # Same compact UTF-8 output as json.dumps(ensure_ascii=False, separators=(",", ":")).
+    body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    with open(tmp, "wb") as f:
         f.write(body)
     os.replace(tmp, path)
     try:
@@ -73,8 +75,8 @@ def load_payload_json(ref: str) -> Any | None:
         path = ref[len("file:") :].strip()
     if path.startswith("/") or path.startswith("./"):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         except Exception as exc:
             logger.warning("payload_read_failed path=%s err=%s", path, exc)
             # Fallback: if we can infer a job_id from the filename, try Postgres.
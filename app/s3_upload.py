@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 import os
 import re
@@ -9,6 +10,7 @@ from typing import Any, Dict, Optional
 
 import boto3
 import logging
+from boto3.s3.transfer import TransferConfig
 
 
 AWS_REGION = os.getenv("AWS_REGION", "us-east-2")
@@ -22,6 +24,9 @@ S3_CLIENT_FORM_SCAN_LIMIT = int(os.getenv("S3_CLIENT_FORM_SCAN_LIMIT", "2000"))
 
 
 _s3 = boto3.client("s3", region_name=AWS_REGION)
+# Bodies above S3's 5 MB minimum part size go up as a managed multipart upload.
+_MULTIPART_THRESHOLD = 5 * 1024 * 1024
+_MULTIPART_CONFIG = TransferConfig(multipart_threshold=_MULTIPART_THRESHOLD, multipart_chunksize=_MULTIPART_THRESHOLD)
 _CST = ZoneInfo("America/Chicago")
 logger = logging.getLogger(__name__)
 
@@ -256,11 +261,25 @@ def build_monthly_logs_filename(month_name: str, year: int) -> str:
 
 
 def upload_json(prefix: str, filename: str, data: Any) -> str:
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return upload_bytes(prefix, filename, body)
+
+
+def upload_bytes(
+    prefix: str,
+    filename: str,
+    body: bytes,
+    *,
+    content_type: str = "application/json; charset=utf-8",
+    content_encoding: str | None = None,
+) -> str:
     if not prefix.endswith("/"):
         prefix += "/"
     key = f"{prefix}{filename}"
 
-    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    extra: Dict[str, Any] = {"ContentType": content_type}
+    if content_encoding:
+        extra["ContentEncoding"] = content_encoding
 
     try:
         logger.info(
@@ -270,12 +289,10 @@ def upload_json(prefix: str, filename: str, data: Any) -> str:
             len(body),
             AWS_REGION,
         )
-        _s3.put_object(
-            Bucket=S3_BUCKET,
-            Key=key,
-            Body=body,
-            ContentType="application/json; charset=utf-8",
-        )
+        if len(body) > _MULTIPART_THRESHOLD:
+            _s3.upload_fileobj(io.BytesIO(body), S3_BUCKET, key, ExtraArgs=extra, Config=_MULTIPART_CONFIG)
+        else:
+            _s3.put_object(Bucket=S3_BUCKET, Key=key, Body=body, **extra)
         logger.info("s3_put_object_ok bucket=%s key=%s", S3_BUCKET, key)
     except Exception as exc:
         logger.exception(
@@ -323,9 +340,19 @@ def upload_delivered_copy(*, job_id: str, client_name: str, data: Any) -> str:
     return upload_json(prefix, filename, data)
 
 
-def upload_monthly_logs(month_name: str, year: int, logs: Any) -> str:
+def upload_monthly_logs(month_name: str, year: int, gzipped_body: bytes) -> str:
+    """
+    Upload an already gzip-compressed JSON document; S3 serves it back with
+    Content-Encoding: gzip so clients decode it transparently.
+    """
     filename = build_monthly_logs_filename(month_name, year)
-    return upload_json(S3_MONTHLY_LOGS_PREFIX, filename, logs)
+    return upload_bytes(
+        S3_MONTHLY_LOGS_PREFIX,
+        filename,
+        gzipped_body,
+        content_type="application/json",
+        content_encoding="gzip",
+    )
 
 
 def download_json(key: str, *, bucket: str | None = None) -> Any:
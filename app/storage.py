@@ -36,6 +36,22 @@ async def register_job(job_id: str) -> None:
     await r.expire("jobs:index", JOB_TTL_SECONDS)
 
 
+async def create_job(job_id: str, status: str, payload: Any) -> None:
+    # register_job + set_status + set_payload for a fresh job, sent as one MULTI/EXEC round trip.
+    r = _client()
+    ts = int(time.time())
+    async with r.pipeline(transaction=True) as pipe:
+        pipe.zadd("jobs:index", {job_id: ts})
+        pipe.expire("jobs:index", JOB_TTL_SECONDS)
+        pipe.set(_k(job_id, "status"), status, ex=JOB_TTL_SECONDS)
+        pipe.set(
+            _k(job_id, "payload"),
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str),
+            ex=PAYLOAD_TTL_SECONDS,
+        )
+        await pipe.execute()
+
+
 async def list_jobs(limit: int = 100, newest_first: bool = True) -> List[str]:
     await purge_inactive()
     r = _client()
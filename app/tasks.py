@@ -6,6 +6,7 @@ from zoneinfo import ZoneInfo
 
 import httpx
 from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import worker_process_init
 from sqlalchemy import select
 
 from .celery_app import celery_app
@@ -38,6 +39,7 @@ from .storage import (
     get_payload,
     is_resume_mode,
 )
+from .models import build_worker_models
 from .monthly_logs import upload_monthly_queue_logs
 from .payload_store import (
     load_payload_json,
@@ -57,6 +59,11 @@ SITE_CHECK_INITIAL_ATTEMPTS = int(os.getenv("SITE_CHECK_INITIAL_ATTEMPTS", "12")
 SITE_CHECK_LONG_INTERVAL_SECONDS = int(os.getenv("SITE_CHECK_LONG_INTERVAL_SECONDS", "3600"))
 
 
+@worker_process_init.connect
+def _build_models_on_worker_start(**_kwargs) -> None:
+    build_worker_models()
+
+
 @celery_app.task(
     bind=True,
     autoretry_for=(Exception,),
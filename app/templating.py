@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+TEMPLATES_DIR = "templates"
+JINJA_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR", "/tmp/jinja_cache").strip()
+
+logger = logging.getLogger(__name__)
+
+
+def _build_environment() -> Environment:
+    # No filesystem access at import; warm_templates attaches the bytecode cache at startup.
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=400,
+    )
+
+
+# Single shared Jinja environment so every router reuses the same compiled-template cache.
+templates = Jinja2Templates(env=_build_environment())
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    if not JINJA_BYTECODE_CACHE_DIR:
+        return None
+    try:
+        os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+    except OSError as exc:
+        logger.warning("jinja_bytecode_cache_disabled dir=%s err=%s", JINJA_BYTECODE_CACHE_DIR, exc)
+        return None
+    if not os.access(JINJA_BYTECODE_CACHE_DIR, os.W_OK):
+        logger.warning("jinja_bytecode_cache_disabled dir=%s err=not writable", JINJA_BYTECODE_CACHE_DIR)
+        return None
+    return FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+
+
+def warm_templates() -> int:
+    """Compile every template up front so the first request doesn't pay for parsing."""
+    env = templates.env
+    if env.bytecode_cache is None:
+        # Templates still render from memory when the cache directory is unavailable.
+        env.bytecode_cache = _bytecode_cache()
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 _SPECIAL_KEY_MAP = {
     "userdata": "user_data",
     "querystring": "query_string",
+    "jobdetails": "job_details",
 }
 
 _UNION_ORIGINS = {Union}
@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional, List
 
 from .sitemap import generate_sitemap
-from .openai_copy import generate_page_with_retries
+from .openai_copy import generate_page_with_retries, new_copy_client
 from .openai_campaign import generate_campaign_page_with_retries
 from .client_identity import build_client_key
 from .compile import compile_final
@@ -561,7 +561,7 @@ async def run_workflow(webhook_payload: Dict[str, Any], job_id: Optional[str] =
             copy_log_lines: List[str] = []
             try:
                 env = await asyncio.wait_for(
-                    generate_page_with_retries(payload, log_lines=copy_log_lines),
+                    generate_page_with_retries(copy_client, payload, log_lines=copy_log_lines),
                     timeout=PAGE_TIMEOUT_SECONDS,
                 )
             except asyncio.TimeoutError:
@@ -586,7 +586,8 @@ async def run_workflow(webhook_payload: Dict[str, Any], job_id: Optional[str] =
                 await prog({"pages_done": counters["done"], "pages_failed": counters["failed"]})
             return env
 
-    results = await asyncio.gather(*(run_page(p) for p in pages))
+    async with new_copy_client() as copy_client:
+        results = await asyncio.gather(*(run_page(p) for p in pages))
     envelopes = [r for r in results if r is not None]
     kind_counts: Dict[str, int] = {}
     utility_paths: List[str] = []
@@ -1,5 +1,6 @@
 import base64
 import os
+from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
 
@@ -25,7 +26,7 @@ def test_admin_deliveries_page_contains_rerun_modals(monkeypatch):
     def _override_db():
         yield fake_session
 
-    monkeypatch.setattr(admin_module, "_list_deliveries", lambda *_args, **_kwargs: ([], 0))
+    monkeypatch.setattr(admin_module, "_list_deliveries", lambda *_args, **_kwargs: ([], None, None, None))
     app.dependency_overrides[get_db_session] = _override_db
     client = TestClient(app)
     try:
@@ -44,3 +45,66 @@ def test_admin_deliveries_page_contains_rerun_modals(monkeypatch):
     assert "Paste Source Form JSON" in resp.text
     assert "Queue Re-run With JSON" in resp.text
     assert "openAdminRerunModal" in resp.text
+
+
+def test_admin_send_now_publishes_after_render(monkeypatch):
+    fake_session = object()
+    calls: list[str] = []
+
+    def _override_db():
+        yield fake_session
+
+    monkeypatch.setattr(admin_module, "_get_delivery", lambda *_args, **_kwargs: object())
+    monkeypatch.setattr(
+        admin_module,
+        "_render_row",
+        lambda *_args, **_kwargs: calls.append("render") or admin_module.HTMLResponse("<tr></tr>"),
+    )
+    monkeypatch.setattr(admin_module.send_delivery, "delay", lambda delivery_id: calls.append(f"delay:{delivery_id}"))
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    delivery_id = "00000000-0000-0000-0000-000000000001"
+    try:
+        resp = client.post(f"/admin/deliveries/{delivery_id}/send-now", headers=_admin_headers())
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert resp.status_code == 200
+    assert calls == ["render", f"delay:{delivery_id}"]
+
+
+def test_admin_send_version_publishes_after_render(monkeypatch):
+    fake_session = object()
+    calls: list[str] = []
+
+    def _override_db():
+        yield fake_session
+
+    row = SimpleNamespace(job_id="job-1", client_name="Acme")
+    monkeypatch.setattr(admin_module, "_get_delivery", lambda *_args, **_kwargs: row)
+    monkeypatch.setattr(admin_module, "delivery_client_key", lambda *_args, **_kwargs: "acme")
+    monkeypatch.setattr(
+        admin_module,
+        "list_version_options_for_client",
+        lambda *_args, **_kwargs: [SimpleNamespace(job_id="job-2")],
+    )
+    monkeypatch.setattr(
+        admin_module,
+        "_render_row",
+        lambda *_args, **_kwargs: calls.append("render") or admin_module.HTMLResponse("<tr></tr>"),
+    )
+    monkeypatch.setattr(
+        admin_module.send_delivery,
+        "delay",
+        lambda *args: calls.append(f"delay:{args}"),
+    )
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    delivery_id = "00000000-0000-0000-0000-000000000001"
+    try:
+        resp = client.post(f"/admin/deliveries/{delivery_id}/send-version", headers=_admin_headers(), data={"replay": "1"})
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert resp.status_code == 200
+    assert calls == ["render", f"delay:{(delivery_id, 'pro', True, 'db:job-2')}"]
@@ -0,0 +1,119 @@
+import base64
+import os
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("PRO_COPY_ASSISTANT_ID", "test-copy")
+os.environ.setdefault("PRO_SITEMAP_ASSISTANT_ID", "test-sitemap")
+os.environ.setdefault("ADMIN_PASSWORD", "admin-pass")
+os.environ.setdefault("API_BEARER_TOKEN", "test-token")
+
+import app.admin as admin_module
+from app.db import get_db_session
+from app.main import app
+from app.pagination import decode_cursor, encode_cursor, split_page
+
+
+def _admin_headers() -> dict[str, str]:
+    encoded = base64.b64encode(b"admin:admin-pass").decode("ascii")
+    return {"Authorization": f"Basic {encoded}"}
+
+
+class _Row:
+    def __init__(self, created_at: datetime):
+        self.id = uuid.uuid4()
+        self.created_at = created_at
+
+
+def test_cursor_round_trip():
+    ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(ts, row_id)) == (ts, row_id)
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+def test_split_page_uses_extra_row_as_next_marker():
+    rows = [_Row(datetime(2026, 1, day, tzinfo=timezone.utc)) for day in (5, 4, 3)]
+
+    page, next_cursor = split_page(rows, 2, "created_at")
+    assert page == rows[:2]
+    assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+
+    page, next_cursor = split_page(rows, 3, "created_at")
+    assert page == rows
+    assert next_cursor is None
+
+
+def test_deliveries_page_rejects_malformed_cursor(monkeypatch):
+    def _override_db():
+        yield object()
+
+    monkeypatch.setattr(admin_module, "_list_deliveries", lambda *_args, **_kwargs: ([], None, None, None))
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    try:
+        resp = client.get("/admin/deliveries", params={"before": "not-a-cursor"}, headers=_admin_headers())
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert resp.status_code == 400
+
+
+def test_deliveries_api_rejects_malformed_cursor():
+    def _override_db():
+        yield object()
+
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    try:
+        resp = client.get("/deliveries", params={"before": "not-a-cursor"})
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert resp.status_code == 400
+
+
+class _TotalRow(_Row):
+    total_count = 1
+
+
+class _RecordingSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        rows = self.rows
+        return type("_Result", (), {"all": lambda _self: rows})()
+
+
+def test_admin_delivery_list_folds_total_into_first_page():
+    session = _RecordingSession([_TotalRow(datetime(2026, 1, 5, tzinfo=timezone.utc))])
+
+    rows, next_cursor, _prev_cursor, total = admin_module._list_deliveries(session, "READY", None, 50, with_total=True)
+
+    assert len(rows) == 1
+    assert next_cursor is None
+    assert total == 1
+    assert len(session.statements) == 1
+    assert "count(*) OVER ()" in str(session.statements[0])
+
+
+def test_after_cursor_walks_back_towards_newest():
+    ascending = [_Row(datetime(2026, 1, day, tzinfo=timezone.utc)) for day in (3, 4, 5)]
+    session = _RecordingSession(ascending)
+    after = (datetime(2026, 1, 2, tzinfo=timezone.utc), uuid.uuid4())
+
+    rows, next_cursor, prev_cursor, total = admin_module._list_deliveries(session, None, None, 2, after=after)
+
+    # Newest-first again, and both directions stay open: the after= row is older, day 5 is newer.
+    assert rows == [ascending[1], ascending[0]]
+    assert decode_cursor(next_cursor) == (ascending[0].created_at, ascending[0].id)
+    assert decode_cursor(prev_cursor) == (ascending[1].created_at, ascending[1].id)
+    assert total is None
+    assert "ORDER BY delivery_outbox.created_at ASC" in str(session.statements[0])
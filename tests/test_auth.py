@@ -0,0 +1,34 @@
+import base64
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import require_admin_auth
+
+
+def _basic(user: str, password: str) -> str:
+    return "Basic " + base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+
+
+def test_admin_auth_accepts_any_username(monkeypatch):
+    monkeypatch.setenv("ADMIN_PASSWORD", "admin-pass")
+    require_admin_auth(_basic("admin", "admin-pass"))
+    require_admin_auth(_basic("someone-else", "admin-pass"))
+
+
+def test_admin_auth_rejects_wrong_password(monkeypatch):
+    monkeypatch.setenv("ADMIN_PASSWORD", "admin-pass")
+    with pytest.raises(HTTPException) as exc:
+        require_admin_auth(_basic("admin", "nope"))
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.parametrize(
+    "header",
+    ["Basic", "Bearer abc", "Basic !!!not-base64!!!", "Basic " + base64.b64encode(b"no-colon").decode("ascii")],
+)
+def test_admin_auth_rejects_malformed_header(monkeypatch, header):
+    monkeypatch.setenv("ADMIN_PASSWORD", "admin-pass")
+    with pytest.raises(HTTPException) as exc:
+        require_admin_auth(header)
+    assert exc.value.status_code == 401
@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from kombu.exceptions import EncodeError
+from kombu.serialization import dumps, loads, prepare_accept_content
+
+from app.celery_app import celery_app
+
+
+def _round_trip(body, serializer):
+    content_type, content_encoding, data = dumps(body, serializer=serializer)
+    accept = prepare_accept_content(celery_app.conf.accept_content)
+    return content_type, loads(data, content_type, content_encoding, accept=accept)
+
+
+def test_task_body_round_trips_through_orjson():
+    body = ([], {"job_id": "job-1", "payload": {"metadata": {"business_name": "Acme"}, 7: "int key"}}, {})
+
+    content_type, decoded = _round_trip(body, celery_app.conf.task_serializer)
+
+    assert content_type == "application/x-orjson"
+    assert decoded == [[], {"job_id": "job-1", "payload": {"metadata": {"business_name": "Acme"}, "7": "int key"}}, {}]
+
+
+def test_task_body_rejects_unsupported_argument():
+    with pytest.raises(EncodeError):
+        dumps({"payload": object()}, serializer=celery_app.conf.task_serializer)
+
+
+def test_json_result_keeps_tagged_types():
+    sent_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    delivery_id = UUID("12345678-1234-5678-1234-567812345678")
+    result = {"status": "SUCCESS", "result": {"sent_at": sent_at, "delivery_id": delivery_id}}
+
+    content_type, decoded = _round_trip(result, celery_app.conf.result_serializer)
+
+    assert content_type == "application/json"
+    assert decoded["result"] == {"sent_at": sent_at, "delivery_id": delivery_id}
@@ -1,4 +1,5 @@
 from app.compile import compile_final
+from app.models import HomeEnvelope
 
 
 def test_compile_keeps_utility_page_title():
@@ -37,3 +38,46 @@ def test_compile_derives_page_title_from_hero():
     content = final["data"]["content"]
 
     assert content["utility_pages"][0]["page_title"] == "Why Choose Us"
+
+
+def test_compile_omits_missing_page_title_only():
+    envelopes = [
+        {"page_kind": "home", "path": "/", "home": {"html_title": "Home"}},
+        {"page_kind": "about", "path": "/about", "about": {"page_title": "About Us"}},
+        {"page_kind": "seo_page", "path": "/services/roofing", "seo_page": {"post_title": "Roofing"}},
+    ]
+
+    final = compile_final(envelopes)
+    content = final["data"]["content"]
+
+    assert "page_title" not in content["home"]
+    assert content["about"]["page_title"] == "About Us"
+    assert "page_title" not in content["seo_pages"][0]
+
+
+def test_envelope_dumps_keep_null_page_title():
+    envelope = HomeEnvelope.model_validate({"page_kind": "home", "path": "/", "home": {"html_title": "Home"}})
+
+    # Only compile output omits it; stored envelopes keep the explicit null.
+    assert envelope.model_dump(mode="json")["home"]["page_title"] is None
+
+
+def test_compile_validates_utility_pages_built_from_malformed_output():
+    envelopes = [
+        {
+            "page_kind": "utility_page",
+            "path": "/about/why-choose-us",
+            "utility_page": {
+                "content_page_type": "about-why",
+                "page_title": "Why Choose Us",
+                "about_values": {"title": 7, "about_values_content": ["not a dict", {"heading": None}]},
+                "about_cta": "not a dict",
+            },
+        }
+    ]
+
+    page = compile_final(envelopes)["data"]["content"]["utility_pages"][0]
+
+    assert page["about_values"]["title"] == ""
+    assert all(item == {"heading": "", "content": ""} for item in page["about_values"]["about_values_content"])
+    assert page["about_cta"] == {"title": "", "content": ""}
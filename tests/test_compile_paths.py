@@ -64,3 +64,52 @@ def test_compile_final_raises_on_missing_seo_slug():
 
     with pytest.raises(ValueError, match="seo_page"):
         compile_final(envelopes)
+
+
+def test_compile_final_normalizes_utility_about_values_items():
+    envelopes = [
+        {
+            "page_kind": "utility_page",
+            "path": "/about/our-team",
+            "utility_page": {
+                "content_page_type": "about-team",
+                "about_values": {
+                    "title": "Values",
+                    "about_values_content": [
+                        {"heading": "Care", "content": "We listen."},
+                        "not-a-dict",
+                        {"heading": 3, "content": "Numbers are dropped."},
+                    ],
+                },
+            },
+        }
+    ]
+
+    utility = compile_final(envelopes)["data"]["content"]["utility_pages"][0]
+
+    assert utility["about_values"] == {
+        "title": "Values",
+        "subtitle": "",
+        "about_values_content": [
+            {"heading": "Care", "content": "We listen."},
+            {"heading": "", "content": "Numbers are dropped."},
+            {"heading": "", "content": ""},
+            {"heading": "", "content": ""},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("HVAC Repair", "hvac-repair"),
+        ("  --Why   Choose__Us?--  ", "why-choose-us"),
+        ("Café & Bar", "caf-bar"),
+        ("!!!", ""),
+        (None, ""),
+    ],
+)
+def test_slugify_collapses_non_alnum_runs(value, expected):
+    from app.compile import _slugify
+
+    assert _slugify(value) == expected
@@ -0,0 +1,68 @@
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import orjson
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("PRO_COPY_ASSISTANT_ID", "test-copy")
+os.environ.setdefault("PRO_SITEMAP_ASSISTANT_ID", "test-sitemap")
+
+import app.deliveries as deliveries_module
+from app.db_models import DeliveryOutbox
+from app.main import app
+
+
+def _delivery(job_id: str) -> DeliveryOutbox:
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return DeliveryOutbox(
+        id=uuid.uuid4(),
+        job_id=job_id,
+        client_name="Acme",
+        payload_s3_key=f"db:{job_id}",
+        default_target_url="https://example.com",
+        status="SENT",
+        attempt_count=1,
+        site_check_attempts=0,
+        created_at=ts,
+        updated_at=ts,
+    )
+
+
+class _FakeScalarResult:
+    def __init__(self, batches):
+        self._batches = batches
+
+    def partitions(self):
+        return iter(self._batches)
+
+
+class _FakeSession:
+    def __init__(self, batches):
+        self.batches = batches
+        self.statements = []
+
+    def scalars(self, stmt):
+        self.statements.append(stmt)
+        return _FakeScalarResult(self.batches)
+
+
+def test_export_streams_one_json_line_per_delivery(monkeypatch):
+    session = _FakeSession([[_delivery("job-1"), _delivery("job-2")], [_delivery("job-3")]])
+
+    @contextmanager
+    def _fake_scope():
+        yield session
+
+    monkeypatch.setattr(deliveries_module, "session_scope", _fake_scope)
+    client = TestClient(app)
+    resp = client.get("/deliveries/export", params={"status": "SENT"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [orjson.loads(line) for line in resp.content.splitlines()]
+    assert [line["job_id"] for line in lines] == ["job-1", "job-2", "job-3"]
+    assert lines[0]["created_at"] == "2026-01-01T00:00:00Z"
+    assert session.statements[0].get_execution_options()["yield_per"] == deliveries_module.EXPORT_BATCH_SIZE
@@ -0,0 +1,148 @@
+import os
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("PRO_COPY_ASSISTANT_ID", "test-copy")
+os.environ.setdefault("PRO_SITEMAP_ASSISTANT_ID", "test-sitemap")
+
+from app.db import get_db_session
+from app.main import app
+
+
+class _FakeRow:
+    def __init__(self, job_id: str, total: int):
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.id = uuid.uuid4()
+        self.job_id = job_id
+        self.client_name = "Acme"
+        self.payload_s3_key = f"db:{job_id}"
+        self.default_target_url = "https://example.com"
+        self.override_target_url = None
+        self.preview_url = None
+        self.status = "SENT"
+        self.scheduled_for = None
+        self.attempt_count = 1
+        self.site_check_attempts = 0
+        self.site_check_next_at = None
+        self.last_error = None
+        self.created_at = ts
+        self.updated_at = ts
+        self.sent_at = None
+        self.total_count = total
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def scalar_one(self):
+        return len(self._rows)
+
+
+class _CountingSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return _FakeResult(self.rows)
+
+    def scalars(self, stmt):
+        raise AssertionError("the listing should not hydrate ORM entities")
+
+
+def test_list_deliveries_first_page_is_one_query():
+    session = _CountingSession([_FakeRow("job-1", 2), _FakeRow("job-2", 2)])
+
+    def _override_db():
+        yield session
+
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    try:
+        resp = client.get("/deliveries", params={"with_total": "1", "page_size": 5})
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["job_id"] for item in body["items"]] == ["job-1", "job-2"]
+    assert body["total"] == 2
+    assert body["next_cursor"] is None
+    # Rows and total arrive together; no per-row lazy loads or separate count.
+    assert len(session.statements) == 1
+
+
+def test_list_deliveries_still_accepts_legacy_page_number():
+    session = _CountingSession([_FakeRow("job-3", 2)])
+
+    def _override_db():
+        yield session
+
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    try:
+        resp = client.get("/deliveries", params={"page": 3, "page_size": 5})
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["page"] == 3
+    assert body["total"] == 1
+    assert [item["job_id"] for item in body["items"]] == ["job-3"]
+    count_stmt, page_stmt = session.statements
+    assert "count" in str(count_stmt).lower()
+    # Page 3 of 5 skips ten rows and still fetches one extra to detect the next page.
+    assert page_stmt.compile().params == {"param_1": 6, "param_2": 10}
+
+
+class _ScalarResult(_FakeResult):
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+    def one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class _DeliverySession:
+    def __init__(self, row):
+        self.row = row
+        self.full_fetches = 0
+
+    def execute(self, stmt):
+        if len(stmt.selected_columns) == 1:
+            return _ScalarResult([self.row.updated_at])
+        self.full_fetches += 1
+        return _ScalarResult([self.row])
+
+
+def test_get_delivery_serves_unchanged_row_from_cache():
+    row = _FakeRow("job-cache", 1)
+    session = _DeliverySession(row)
+
+    def _override_db():
+        yield session
+
+    app.dependency_overrides[get_db_session] = _override_db
+    client = TestClient(app)
+    try:
+        first = client.get(f"/deliveries/{row.id}").json()
+        second = client.get(f"/deliveries/{row.id}").json()
+        row.updated_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        row.status = "FAILED"
+        third = client.get(f"/deliveries/{row.id}").json()
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+    assert first == second
+    assert third["status"] == "FAILED"
+    # Only the first read and the read after updated_at moved load the full row.
+    assert session.full_fetches == 2
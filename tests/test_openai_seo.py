@@ -0,0 +1,86 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from app import openai_seo
+
+
+class _FakeRuns:
+    def __init__(self):
+        self.submitted = []
+
+    @asynccontextmanager
+    async def submit_tool_outputs_stream(self, *, thread_id, run_id, tool_outputs, event_handler):
+        self.submitted.append((thread_id, run_id, tool_outputs))
+        message = SimpleNamespace(content=[SimpleNamespace(text=SimpleNamespace(value="1. HVAC repair\n2. AC install"))])
+        await event_handler.on_message_done(message)
+        await event_handler.on_event(SimpleNamespace(event="thread.run.completed", data=SimpleNamespace(status="completed")))
+
+        async def _until_done():
+            return None
+
+        yield SimpleNamespace(until_done=_until_done)
+
+
+def test_seo_run_handler_answers_tool_call_and_collects_reply(monkeypatch):
+    async def _fake_fetch(domain_url):
+        return f'{{"domain": "{domain_url}"}}'
+
+    monkeypatch.setattr(openai_seo, "_fetch_website_seo_data", _fake_fetch)
+    runs = _FakeRuns()
+    client = SimpleNamespace(beta=SimpleNamespace(threads=SimpleNamespace(runs=runs)))
+    result = {"status": "", "raw": ""}
+    handler = openai_seo._SEORunHandler(client, "example.com", result)
+    tool = SimpleNamespace(id="call_1", function=SimpleNamespace(name="analyze_client_website", arguments="{}"))
+    run = SimpleNamespace(
+        id="run_1",
+        thread_id="thread_1",
+        required_action=SimpleNamespace(submit_tool_outputs=SimpleNamespace(tool_calls=[tool])),
+    )
+
+    asyncio.run(handler.on_event(SimpleNamespace(event="thread.run.requires_action", data=run)))
+
+    assert runs.submitted == [
+        ("thread_1", "run_1", [{"tool_call_id": "call_1", "output": '{"domain": "example.com"}'}])
+    ]
+    assert result["status"] == "completed"
+    assert openai_seo._parse_keywords(result["raw"]) == ["HVAC repair", "AC install"]
+
+
+def test_run_assistant_times_out_on_whole_run(monkeypatch):
+    class _EndlessRuns:
+        @asynccontextmanager
+        async def stream(self, **kwargs):
+            async def _until_done():
+                # Keeps "receiving events" forever; only the overall run budget can stop it.
+                while True:
+                    await asyncio.sleep(0.01)
+
+            yield SimpleNamespace(until_done=_until_done)
+
+    async def _create(**kwargs):
+        return SimpleNamespace(id="thread_1")
+
+    class _FakeClient:
+        closed = False
+
+        def __init__(self, **kwargs):
+            threads = SimpleNamespace(create=_create, messages=SimpleNamespace(create=_create), runs=_EndlessRuns())
+            self.beta = SimpleNamespace(threads=threads)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            _FakeClient.closed = True
+
+    monkeypatch.setattr(openai_seo, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(openai_seo, "ASSISTANT_RUN_TIMEOUT", 0.05)
+    monkeypatch.setattr(openai_seo, "AsyncOpenAI", _FakeClient)
+
+    out = asyncio.run(
+        openai_seo._run_assistant(assistant_id="asst_1", user_json_input={}, domain_url="example.com")
+    )
+
+    assert out == {"ok": False, "error": "timeout_waiting_for_assistant", "keywords": [], "raw": ""}
+    assert _FakeClient.closed
@@ -0,0 +1,22 @@
+from app import templating
+
+
+def test_warm_templates_falls_back_without_cache_dir(monkeypatch, tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(templating, "JINJA_BYTECODE_CACHE_DIR", str(blocker / "cache"))
+    monkeypatch.setattr(templating.templates.env, "bytecode_cache", None)
+
+    assert templating.warm_templates() > 0
+    assert templating.templates.env.bytecode_cache is None
+
+
+def test_warm_templates_attaches_bytecode_cache(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setattr(templating, "JINJA_BYTECODE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(templating.templates.env, "bytecode_cache", None)
+
+    templating.warm_templates()
+
+    assert templating.templates.env.bytecode_cache is not None
+    assert cache_dir.is_dir()
@@ -17,9 +17,7 @@ def client(monkeypatch):
     async def _noop(*args, **kwargs):
         return None
 
-    monkeypatch.setattr("app.main.register_job", _noop)
-    monkeypatch.setattr("app.main.set_status", _noop)
-    monkeypatch.setattr("app.main.set_payload", _noop)
+    monkeypatch.setattr("app.main.create_job", _noop)
     monkeypatch.setattr(
         "app.main.run_full_job",
         SimpleNamespace(delay=lambda *args, **kwargs: None),
@@ -80,3 +78,92 @@ def test_webhook_invalid_type_rejected(client):
     }
     resp = client.post("/webhook/pro-form", headers=_headers(), json=payload)
     assert resp.status_code == 422
+
+
+def test_webhook_rejects_wrong_bearer_token(client):
+    payload = {"metadata": {"business_domain": "example.com"}}
+    resp = client.post("/webhook/pro-form", headers={"Authorization": "Bearer wrong-token"}, json=payload)
+    assert resp.status_code == 403
+    resp = client.post("/webhook/pro-form", json=payload)
+    assert resp.status_code == 401
+
+
+def test_webhook_normalizes_keys_once(client, monkeypatch, caplog):
+    from app import models
+
+    calls = []
+    real_normalize = models.normalize_webhook_payload
+
+    def _counting(data):
+        calls.append(data)
+        return real_normalize(data)
+
+    monkeypatch.setattr(models, "normalize_webhook_payload", _counting)
+    payload = {"metadata": {"businessDomain": "example.com"}, "userData": {"serviceOfferings": ["A"]}}
+    with caplog.at_level("INFO", logger="app.main"):
+        resp = client.post("/webhook/pro-form", headers=_headers(), json=payload)
+    assert resp.status_code == 200
+    # The key log reuses the model's normalized input.
+    assert len(calls) == 1
+    assert any("keys=['metadata', 'user_data']" in r.getMessage() for r in caplog.records)
+
+
+def test_webhook_request_schema_is_published():
+    operation = app.openapi()["paths"]["/webhook/pro-form"]["post"]
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert schema == {"$ref": "#/components/schemas/WebhookInput"}
+
+
+def test_webhook_malformed_json_rejected(client):
+    resp = client.post(
+        "/webhook/pro-form",
+        headers={**_headers(), "content-type": "application/json"},
+        content=b"{not json",
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_webhook_logs_unknown_keys_after_response(client, caplog):
+    payload = {"metadata": {"business_domain": "example.com", "unknown_meta": "x"}, "extra_top": 1}
+    with caplog.at_level("INFO", logger="app.main"):
+        resp = client.post("/webhook/pro-form", headers=_headers(), json=payload)
+    assert resp.status_code == 200
+    warnings = [r.getMessage() for r in caplog.records if "unknown_keys" in r.getMessage()]
+    assert warnings and "extra_top" in warnings[0] and "metadata.unknown_meta" in warnings[0]
+
+
+def test_webhook_skips_key_diagnostics_that_would_be_dropped(client, monkeypatch, caplog):
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("unknown-key scan should not run when WARNING is filtered out")
+
+    payload = {"metadata": {"business_domain": "example.com"}, "extra_top": 1}
+    with caplog.at_level("WARNING", logger="app.main"):
+        resp = client.post("/webhook/pro-form", headers=_headers(), json=payload)
+    assert resp.status_code == 200
+    messages = [r.getMessage() for r in caplog.records]
+    assert any("unknown_keys" in m for m in messages)
+    assert not any("webhook_pro_form keys" in m for m in messages)
+
+    monkeypatch.setattr("app.main.collect_unknown_fields", _fail)
+    with caplog.at_level("ERROR", logger="app.main"):
+        resp = client.post("/webhook/pro-form", headers=_headers(), json=payload)
+    assert resp.status_code == 200
+
+
+def test_webhook_input_accepts_legacy_key_spellings():
+    from app.models import WebhookInput
+
+    payload = WebhookInput.model_validate(
+        {
+            "metadata": {"domainName": "example.com", "businessName": "Acme"},
+            "userdata": {"serviceOfferings": ["A"]},
+            "querystring": {"utm_source": "x"},
+            "jobdetails": {"priority": "high"},
+        }
+    )
+    assert payload.metadata.business_domain == "example.com"
+    assert payload.metadata.business_name == "Acme"
+    assert payload.user_data.service_offerings == ["A"]
+    assert payload.query_string == {"utm_source": "x"}
+    assert payload.job_details == {"priority": "high"}
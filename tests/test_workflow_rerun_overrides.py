@@ -72,7 +72,7 @@ def test_run_workflow_applies_specific_instructions_to_every_page_payload(monkey
         captured_sitemap_user_data.update(user_data)
         return _base_sitemap()
 
-    async def _fake_generate_page_with_retries(payload, log_lines=None):
+    async def _fake_generate_page_with_retries(client, payload, log_lines=None):
         captured_payloads.append(payload)
         return {"page_kind": "skip", "path": payload.get("this_page", {}).get("path", ""), "reason": "non-generative"}
 